@@ -11,6 +11,7 @@ from sqlalchemy.ext.asyncio import async_engine_from_config
 from myome.core.config import settings
 from myome.core.database import Base
 from myome.core.models import *  # noqa: F401, F403 - Import all models to register them
+from myome.hereditary import models as hereditary_models  # noqa: F401
 
 config = context.config
 
@@ -0,0 +1,192 @@
+"""Create hereditary tables
+
+Revision ID: 003_hereditary
+Revises: 002_hypertables
+Create Date: 2026-10-15
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "003_hereditary"
+down_revision: str | None = "002_hypertables"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # Family members
+    op.create_table(
+        "family_members",
+        sa.Column(
+            "id",
+            postgresql.UUID(as_uuid=False),
+            server_default=sa.text("uuid_generate_v4()"),
+            nullable=False,
+        ),
+        sa.Column("user_id", postgresql.UUID(as_uuid=False), nullable=False),
+        sa.Column("relationship", sa.String(50), nullable=False),
+        sa.Column("name", sa.String(100), nullable=True),
+        sa.Column("birth_year", sa.Integer(), nullable=True),
+        sa.Column("death_year", sa.Integer(), nullable=True),
+        sa.Column("biological_sex", sa.String(20), nullable=True),
+        sa.Column("is_living", sa.Boolean(), nullable=False),
+        sa.Column("conditions", sa.JSON(), nullable=True),
+        sa.Column("biomarkers", sa.JSON(), nullable=True),
+        sa.Column("medications", sa.JSON(), nullable=True),
+        sa.Column("smoking_status", sa.String(50), nullable=True),
+        sa.Column("alcohol_use", sa.String(50), nullable=True),
+        sa.Column("cause_of_death", sa.String(200), nullable=True),
+        sa.Column("age_at_death", sa.Integer(), nullable=True),
+        sa.Column("connected_user_id", postgresql.UUID(as_uuid=False), nullable=True),
+        sa.Column("data_source", sa.String(50), nullable=False),
+        sa.Column("confidence_score", sa.Float(), nullable=False),
+        sa.Column("notes", sa.Text(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_family_members_user_id", "family_members", ["user_id"])
+
+    # Uploaded family documents
+    op.create_table(
+        "family_documents",
+        sa.Column(
+            "id",
+            postgresql.UUID(as_uuid=False),
+            server_default=sa.text("uuid_generate_v4()"),
+            nullable=False,
+        ),
+        sa.Column("user_id", postgresql.UUID(as_uuid=False), nullable=False),
+        sa.Column("family_member_id", postgresql.UUID(as_uuid=False), nullable=True),
+        sa.Column("filename", sa.String(255), nullable=False),
+        sa.Column("document_type", sa.String(50), nullable=False),
+        sa.Column("file_path", sa.String(500), nullable=False),
+        sa.Column("file_size_bytes", sa.Integer(), nullable=False),
+        sa.Column("extraction_status", sa.String(50), nullable=False),
+        sa.Column("extracted_at", sa.DateTime(), nullable=True),
+        sa.Column("extracted_text", sa.Text(), nullable=True),
+        sa.Column("extracted_data", sa.JSON(), nullable=True),
+        sa.Column("extraction_confidence", sa.Float(), nullable=True),
+        sa.Column("user_verified", sa.Boolean(), nullable=False),
+        sa.Column("verified_at", sa.DateTime(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.ForeignKeyConstraint(["family_member_id"], ["family_members.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+    # Family-calibrated watchlist
+    op.create_table(
+        "watchlist_items",
+        sa.Column(
+            "id",
+            postgresql.UUID(as_uuid=False),
+            server_default=sa.text("uuid_generate_v4()"),
+            nullable=False,
+        ),
+        sa.Column("user_id", postgresql.UUID(as_uuid=False), nullable=False),
+        sa.Column("biomarker", sa.String(100), nullable=False),
+        sa.Column("display_name", sa.String(100), nullable=False),
+        sa.Column("alert_threshold", sa.Float(), nullable=False),
+        sa.Column("alert_direction", sa.String(20), nullable=False),
+        sa.Column("unit", sa.String(50), nullable=False),
+        sa.Column("family_context", sa.Text(), nullable=False),
+        sa.Column(
+            "contributing_family_member_id",
+            postgresql.UUID(as_uuid=False),
+            nullable=True,
+        ),
+        sa.Column("priority", sa.String(20), nullable=False),
+        sa.Column("recommendation", sa.Text(), nullable=True),
+        sa.Column("is_active", sa.Boolean(), nullable=False),
+        sa.Column("last_triggered_at", sa.DateTime(), nullable=True),
+        sa.Column("trigger_count", sa.Integer(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.ForeignKeyConstraint(
+            ["contributing_family_member_id"], ["family_members.id"]
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_watchlist_items_user_id", "watchlist_items", ["user_id"])
+
+    # Generated artifact records
+    op.create_table(
+        "hereditary_artifacts",
+        sa.Column(
+            "id",
+            postgresql.UUID(as_uuid=False),
+            server_default=sa.text("uuid_generate_v4()"),
+            nullable=False,
+        ),
+        sa.Column("user_id", postgresql.UUID(as_uuid=False), nullable=False),
+        sa.Column("artifact_version", sa.String(20), nullable=False),
+        sa.Column("generated_at", sa.DateTime(), nullable=False),
+        sa.Column("data_start_date", sa.DateTime(), nullable=False),
+        sa.Column("data_end_date", sa.DateTime(), nullable=False),
+        sa.Column("privacy_settings", sa.JSON(), nullable=False),
+        sa.Column("file_path", sa.String(500), nullable=True),
+        sa.Column("size_bytes", sa.Integer(), nullable=False),
+        sa.Column("is_encrypted", sa.Boolean(), nullable=False),
+        sa.Column("signature", sa.String(128), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("hereditary_artifacts")
+    op.drop_table("watchlist_items")
+    op.drop_table("family_documents")
+    op.drop_table("family_members")
@@ -0,0 +1,59 @@
+"""Unique OAuth device per user and vendor
+
+Revision ID: 004_unique_oauth_devices
+Revises: 003_hereditary
+Create Date: 2026-10-15
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "004_unique_oauth_devices"
+down_revision: str | None = "003_hereditary"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+OAUTH_VENDOR_CLAUSE = "vendor IN ('whoop', 'withings')"
+
+
+def upgrade() -> None:
+    # Earlier reconnects inserted duplicate devices. Keep the most recently
+    # updated one per user and vendor, moving readings over before the
+    # duplicates are removed so the cascade does not drop them.
+    # asyncpg prepares each statement, so run them one at a time
+    op.execute(
+        f"""
+        CREATE TEMPORARY TABLE duplicate_devices ON COMMIT DROP AS
+        SELECT id, first_value(id) OVER (
+            PARTITION BY user_id, vendor ORDER BY updated_at DESC
+        ) AS keep_id
+        FROM devices
+        WHERE {OAUTH_VENDOR_CLAUSE};
+    """
+    )
+    op.execute("DELETE FROM duplicate_devices WHERE id = keep_id;")
+    op.execute(
+        """
+        UPDATE device_readings r
+        SET device_id = d.keep_id
+        FROM duplicate_devices d
+        WHERE r.device_id = d.id;
+    """
+    )
+    op.execute("DELETE FROM devices WHERE id IN (SELECT id FROM duplicate_devices);")
+
+    op.create_index(
+        "uq_devices_user_oauth_vendor",
+        "devices",
+        ["user_id", "vendor"],
+        unique=True,
+        postgresql_where=sa.text(OAUTH_VENDOR_CLAUSE),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("uq_devices_user_oauth_vendor", table_name="devices")
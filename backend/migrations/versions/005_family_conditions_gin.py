@@ -0,0 +1,50 @@
+"""Index family member conditions
+
+Revision ID: 005_family_conditions_gin
+Revises: 004_unique_oauth_devices
+Create Date: 2026-10-15
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = "005_family_conditions_gin"
+down_revision: str | None = "004_unique_oauth_devices"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # GIN indexing needs jsonb; json has no operator classes
+    op.alter_column(
+        "family_members",
+        "conditions",
+        type_=postgresql.JSONB(),
+        existing_type=sa.JSON(),
+        existing_nullable=True,
+        postgresql_using="conditions::jsonb",
+    )
+    op.create_index(
+        "ix_family_members_conditions",
+        "family_members",
+        ["conditions"],
+        postgresql_using="gin",
+        postgresql_ops={"conditions": "jsonb_path_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_family_members_conditions", table_name="family_members")
+    op.alter_column(
+        "family_members",
+        "conditions",
+        type_=sa.JSON(),
+        existing_type=postgresql.JSONB(),
+        existing_nullable=True,
+        postgresql_using="conditions::json",
+    )
@@ -0,0 +1,72 @@
+"""Daily rollups of time-series readings
+
+Revision ID: 006_daily_rollups
+Revises: 005_family_conditions_gin
+Create Date: 2026-10-15
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "006_daily_rollups"
+down_revision: str | None = "005_family_conditions_gin"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Continuous aggregate name -> (hypertable, averaged columns)
+DAILY_ROLLUPS = {
+    "heart_rate_daily": ("heart_rate_readings", ["heart_rate_bpm", "confidence"]),
+    "hrv_daily": (
+        "hrv_readings",
+        ["sdnn_ms", "rmssd_ms", "pnn50_pct", "lf_hf_ratio"],
+    ),
+    "glucose_daily": ("glucose_readings", ["glucose_mg_dl"]),
+}
+
+
+def upgrade() -> None:
+    """Create daily continuous aggregates with refresh policies"""
+    # Continuous aggregates cannot be created or refreshed in a transaction
+    with op.get_context().autocommit_block():
+        for view, (hypertable, columns) in DAILY_ROLLUPS.items():
+            averages = ", ".join(f"avg({c})::double precision AS {c}" for c in columns)
+            # Real-time aggregation so readings since the last refresh are
+            # still included
+            op.execute(
+                f"""
+                CREATE MATERIALIZED VIEW {view}
+                WITH (
+                    timescaledb.continuous,
+                    timescaledb.materialized_only = false
+                ) AS
+                SELECT user_id, time_bucket(INTERVAL '1 day', timestamp) AS day,
+                       {averages}
+                FROM {hypertable}
+                GROUP BY user_id, day
+                WITH NO DATA;
+            """
+            )
+
+            # No start offset: device syncs backfill history, and only the
+            # invalidated buckets are recomputed on each run
+            op.execute(
+                f"""
+                SELECT add_continuous_aggregate_policy(
+                    '{view}',
+                    start_offset => NULL,
+                    end_offset => INTERVAL '1 hour',
+                    schedule_interval => INTERVAL '1 hour'
+                );
+            """
+            )
+
+            op.execute(f"CALL refresh_continuous_aggregate('{view}', NULL, NULL);")
+
+
+def downgrade() -> None:
+    """Drop daily continuous aggregates (their policies go with them)"""
+    for view in DAILY_ROLLUPS:
+        op.execute(f"DROP MATERIALIZED VIEW IF EXISTS {view};")
@@ -0,0 +1,54 @@
+"""Compress sleep epoch and activity hypertables
+
+Revision ID: 007_compress_epochs_activity
+Revises: 006_daily_rollups
+Create Date: 2026-10-15
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "007_compress_epochs_activity"
+down_revision: str | None = "006_daily_rollups"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# High-volume hypertables not yet compressed by 002_hypertables
+COMPRESSED_TABLES = ["sleep_epochs", "activity_readings"]
+
+
+def upgrade() -> None:
+    """Enable compression on sleep epochs and activity readings"""
+    for table in COMPRESSED_TABLES:
+        # Segment by user so per-user range scans decompress only their rows
+        op.execute(
+            f"""
+            ALTER TABLE {table} SET (
+                timescaledb.compress,
+                timescaledb.compress_segmentby = 'user_id',
+                timescaledb.compress_orderby = 'timestamp DESC'
+            );
+        """
+        )
+
+        op.execute(
+            f"""
+            SELECT add_compression_policy('{table}', INTERVAL '30 days');
+        """
+        )
+
+
+def downgrade() -> None:
+    """Remove compression policies and decompress chunks"""
+    for table in COMPRESSED_TABLES:
+        op.execute(f"SELECT remove_compression_policy('{table}', if_exists => TRUE);")
+        op.execute(
+            f"""
+            SELECT decompress_chunk(c, if_compressed => TRUE)
+            FROM show_chunks('{table}') c;
+        """
+        )
+        op.execute(f"ALTER TABLE {table} SET (timescaledb.compress = false);")
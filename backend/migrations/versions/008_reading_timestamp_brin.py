@@ -0,0 +1,56 @@
+"""Block range indexes on reading timestamps
+
+Revision ID: 008_reading_timestamp_brin
+Revises: 007_compress_epochs_activity
+Create Date: 2026-10-15
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "008_reading_timestamp_brin"
+down_revision: str | None = "007_compress_epochs_activity"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+READING_TABLES = ["biomarker_readings", "device_readings"]
+
+
+def upgrade() -> None:
+    """Replace timestamp B-trees with BRIN indexes"""
+    # Concurrent index builds cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        for table in READING_TABLES:
+            op.create_index(
+                f"ix_{table}_timestamp_brin",
+                table,
+                ["timestamp"],
+                postgresql_using="brin",
+                postgresql_with={"pages_per_range": 32},
+                postgresql_concurrently=True,
+            )
+            op.drop_index(
+                f"ix_{table}_timestamp",
+                table_name=table,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade() -> None:
+    """Restore timestamp B-tree indexes"""
+    with op.get_context().autocommit_block():
+        for table in READING_TABLES:
+            op.create_index(
+                f"ix_{table}_timestamp",
+                table,
+                ["timestamp"],
+                postgresql_concurrently=True,
+            )
+            op.drop_index(
+                f"ix_{table}_timestamp_brin",
+                table_name=table,
+                postgresql_concurrently=True,
+            )
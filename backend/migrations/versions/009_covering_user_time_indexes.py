@@ -0,0 +1,50 @@
+"""Covering user/time indexes for heart rate and glucose
+
+Revision ID: 009_covering_user_time
+Revises: 008_reading_timestamp_brin
+Create Date: 2026-10-15
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "009_covering_user_time"
+down_revision: str | None = "008_reading_timestamp_brin"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Table -> (old index, covering index, included columns)
+COVERING_INDEXES = {
+    "heart_rate_readings": (
+        "ix_hr_user_time",
+        "ix_hr_user_time_cov",
+        ["heart_rate_bpm", "confidence"],
+    ),
+    "glucose_readings": (
+        "ix_glucose_user_time",
+        "ix_glucose_user_time_cov",
+        ["glucose_mg_dl", "trend"],
+    ),
+}
+
+
+def upgrade() -> None:
+    """Replace user/time indexes with ones covering the loaded columns"""
+    for table, (old, new, include) in COVERING_INDEXES.items():
+        op.create_index(
+            new,
+            table,
+            ["user_id", "timestamp"],
+            postgresql_include=include,
+        )
+        op.drop_index(old, table_name=table)
+
+
+def downgrade() -> None:
+    """Restore plain user/time indexes"""
+    for table, (old, new, _) in COVERING_INDEXES.items():
+        op.create_index(old, table, ["user_id", "timestamp"])
+        op.drop_index(new, table_name=table)
@@ -0,0 +1,47 @@
+"""Partial indexes for syncable devices and abnormal results
+
+Revision ID: 010_partial_indexes
+Revises: 009_covering_user_time
+Create Date: 2026-10-15
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "010_partial_indexes"
+down_revision: str | None = "009_covering_user_time"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+SYNCABLE_DEVICE_CLAUSE = "is_connected AND api_credentials IS NOT NULL"
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_devices_syncable",
+        "devices",
+        ["id"],
+        postgresql_where=sa.text(SYNCABLE_DEVICE_CLAUSE),
+    )
+    op.create_index(
+        "ix_biomarker_readings_abnormal",
+        "biomarker_readings",
+        ["user_id", "timestamp"],
+        postgresql_where=sa.text("is_abnormal"),
+    )
+    op.create_index(
+        "ix_lab_results_abnormal",
+        "lab_results",
+        ["user_id"],
+        postgresql_where=sa.text("is_abnormal"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_lab_results_abnormal", table_name="lab_results")
+    op.drop_index("ix_biomarker_readings_abnormal", table_name="biomarker_readings")
+    op.drop_index("ix_devices_syncable", table_name="devices")
@@ -0,0 +1,36 @@
+"""Hash rsid and locus indexes for genomic variants
+
+Revision ID: 011_variant_lookup_indexes
+Revises: 010_partial_indexes
+Create Date: 2026-10-15
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "011_variant_lookup_indexes"
+down_revision: str | None = "010_partial_indexes"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_genomic_variants_rsid_hash",
+        "genomic_variants",
+        ["rsid"],
+        postgresql_using="hash",
+    )
+    op.drop_index("ix_genomic_variants_rsid", table_name="genomic_variants")
+    op.create_index(
+        "ix_genomic_variants_locus", "genomic_variants", ["chromosome", "position"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_genomic_variants_locus", table_name="genomic_variants")
+    op.create_index("ix_genomic_variants_rsid", "genomic_variants", ["rsid"])
+    op.drop_index("ix_genomic_variants_rsid_hash", table_name="genomic_variants")
@@ -0,0 +1,41 @@
+"""Drop indexes shadowed by unique constraints or unused
+
+Revision ID: 012_drop_redundant_indexes
+Revises: 011_variant_lookup_indexes
+Create Date: 2026-10-15
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "012_drop_redundant_indexes"
+down_revision: str | None = "011_variant_lookup_indexes"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Index -> (table, columns)
+REDUNDANT_INDEXES = {
+    # Duplicates the unique constraints' own indexes
+    "ix_users_email": ("users", ["email"]),
+    "ix_biomarker_definitions_code": ("biomarker_definitions", ["code"]),
+    # No query filters readings by type alone
+    "ix_device_readings_reading_type": ("device_readings", ["reading_type"]),
+}
+
+
+def upgrade() -> None:
+    """Drop redundant indexes"""
+    # Concurrent index drops cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        for name, (table, _) in REDUNDANT_INDEXES.items():
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    """Restore the dropped indexes"""
+    with op.get_context().autocommit_block():
+        for name, (table, columns) in REDUNDANT_INDEXES.items():
+            op.create_index(name, table, columns, postgresql_concurrently=True)
@@ -77,56 +77,8 @@ class CorrelationEngine:
             end: End datetime
             lag_days: Time lag in days (positive = biomarker_1 leads)
         """
-        # Load data
-        df = await self.loader.load_multi_biomarker(
-            start,
-            end,
-            biomarkers=[biomarker_1, biomarker_2],
-            resample="1D",
-        )
-
-        if df.empty or biomarker_1 not in df.columns or biomarker_2 not in df.columns:
-            return None
-
-        # Apply lag
-        if lag_days != 0:
-            if lag_days > 0:
-                # biomarker_1 leads biomarker_2
-                x = df[biomarker_1].iloc[:-lag_days].values
-                y = df[biomarker_2].iloc[lag_days:].values
-            else:
-                # biomarker_2 leads biomarker_1
-                x = df[biomarker_1].iloc[-lag_days:].values
-                y = df[biomarker_2].iloc[:lag_days].values
-        else:
-            x = df[biomarker_1].values
-            y = df[biomarker_2].values
-
-        # Remove NaN pairs
-        valid = ~(np.isnan(x) | np.isnan(y))
-        x = x[valid]
-        y = y[valid]
-
-        if len(x) < self.min_samples:
-            return None
-
-        # Compute correlation
-        r, p_value = stats.pearsonr(
-            np.asarray(x, dtype=float), np.asarray(y, dtype=float)
-        )
-
-        return CorrelationResult(
-            biomarker_1=biomarker_1,
-            biomarker_2=biomarker_2,
-            correlation=float(r),
-            p_value=float(p_value),
-            lag_days=lag_days,
-            n_observations=len(x),
-            is_significant=p_value < self.alpha,
-            interpretation=self._interpret_correlation(
-                float(r), biomarker_1, biomarker_2, lag_days
-            ),
-        )
+        df = await self._load_daily(start, end, [biomarker_1, biomarker_2])
+        return self._correlate(df, biomarker_1, biomarker_2, lag_days)
 
     async def find_lagged_correlations(
         self,
@@ -140,20 +92,8 @@ class CorrelationEngine:
 
         Returns correlations for lags from -max_lag to +max_lag days
         """
-        results = []
-
-        for lag in range(-self.max_lag, self.max_lag + 1):
-            result = await self.compute_correlation(
-                biomarker_1,
-                biomarker_2,
-                start,
-                end,
-                lag_days=lag,
-            )
-            if result:
-                results.append(result)
-
-        return sorted(results, key=lambda r: abs(r.correlation), reverse=True)
+        df = await self._load_daily(start, end, [biomarker_1, biomarker_2])
+        return self._lagged_correlations(df, biomarker_1, biomarker_2)
 
     async def discover_all_correlations(
         self,
@@ -180,13 +120,14 @@ class CorrelationEngine:
             self.alpha / n_comparisons if bonferroni_correct else self.alpha
         )
 
+        # Load every series once; each pair and lag is then a slice of it
+        df = await self._load_daily(start, end, biomarkers)
+
         significant_correlations = []
 
         for i, bm1 in enumerate(biomarkers):
             for bm2 in biomarkers[i + 1 :]:
-                lagged_results = await self.find_lagged_correlations(
-                    bm1, bm2, start, end
-                )
+                lagged_results = self._lagged_correlations(df, bm1, bm2)
 
                 for result in lagged_results:
                     # Apply adjusted significance threshold
@@ -200,6 +141,87 @@ class CorrelationEngine:
             reverse=True,
         )
 
+    async def _load_daily(
+        self,
+        start: datetime,
+        end: datetime,
+        biomarkers: list[str],
+    ) -> pd.DataFrame:
+        """Load daily-aligned series for the given biomarkers"""
+        return await self.loader.load_multi_biomarker(
+            start,
+            end,
+            biomarkers=biomarkers,
+            resample="1D",
+        )
+
+    def _lagged_correlations(
+        self,
+        df: pd.DataFrame,
+        biomarker_1: str,
+        biomarker_2: str,
+    ) -> list[CorrelationResult]:
+        """Correlate two loaded series at every lag from -max_lag to +max_lag"""
+        results = []
+
+        for lag in range(-self.max_lag, self.max_lag + 1):
+            result = self._correlate(df, biomarker_1, biomarker_2, lag)
+            if result:
+                results.append(result)
+
+        return sorted(results, key=lambda r: abs(r.correlation), reverse=True)
+
+    def _correlate(
+        self,
+        df: pd.DataFrame,
+        biomarker_1: str,
+        biomarker_2: str,
+        lag_days: int,
+    ) -> CorrelationResult | None:
+        """Correlate two loaded series at a single lag"""
+        if df.empty or biomarker_1 not in df.columns or biomarker_2 not in df.columns:
+            return None
+
+        # Apply lag
+        if lag_days != 0:
+            if lag_days > 0:
+                # biomarker_1 leads biomarker_2
+                x = df[biomarker_1].iloc[:-lag_days].values
+                y = df[biomarker_2].iloc[lag_days:].values
+            else:
+                # biomarker_2 leads biomarker_1
+                x = df[biomarker_1].iloc[-lag_days:].values
+                y = df[biomarker_2].iloc[:lag_days].values
+        else:
+            x = df[biomarker_1].values
+            y = df[biomarker_2].values
+
+        # Remove NaN pairs
+        valid = ~(np.isnan(x) | np.isnan(y))
+        x = x[valid]
+        y = y[valid]
+
+        if len(x) < self.min_samples:
+            return None
+
+        # Compute correlation
+        r, p_value = stats.pearsonr(
+            np.asarray(x, dtype=float), np.asarray(y, dtype=float)
+        )
+
+        return CorrelationResult(
+            biomarker_1=biomarker_1,
+            biomarker_2=biomarker_2,
+            correlation=float(r),
+            p_value=float(p_value),
+            lag_days=lag_days,
+            n_observations=len(x),
+            is_significant=p_value < self.alpha,
+            interpretation=self._interpret_correlation(
+                float(r), biomarker_1, biomarker_2, lag_days
+            ),
+        )
+
     def _interpret_correlation(
         self,
         r: float,
@@ -115,6 +115,83 @@ class TrendAnalyzer:
             percent_change=float(percent_change),
         )
 
+    def compute_trends_batch(self, df: pd.DataFrame) -> dict[str, TrendResult]:
+        """
+        Compute linear trends for every column of a DataFrame at once
+
+        Equivalent to calling compute_trend per column, but the regression
+        sums are computed for all columns together with NaN masking.
+
+        Args:
+            df: DataFrame with datetime index, one biomarker per column
+        """
+        if len(df) < 7 or df.shape[1] == 0:
+            return {}
+
+        y = df.to_numpy(dtype=float)
+        mask = ~np.isnan(y)
+        n = mask.sum(axis=0).astype(float)
+        y = np.where(mask, y, 0.0)
+
+        x = np.asarray((df.index - df.index.min()).days, dtype=float)[:, None]
+        xm = np.where(mask, x, 0.0)
+
+        # Per-column least squares from masked sums
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean_x = xm.sum(axis=0) / n
+            mean_y = y.sum(axis=0) / n
+            dx = np.where(mask, x - mean_x, 0.0)
+            dy = np.where(mask, y - mean_y, 0.0)
+            ssxm = (dx * dx).sum(axis=0)
+            ssym = (dy * dy).sum(axis=0)
+            ssxym = (dx * dy).sum(axis=0)
+
+            slope = ssxym / ssxm
+            intercept = mean_y - slope * mean_x
+            r = ssxym / np.sqrt(ssxm * ssym)
+            r = np.clip(r, -1.0, 1.0)
+            dof = n - 2
+            t_stat = r * np.sqrt(dof / ((1.0 - r) * (1.0 + r) + 1e-20))
+        p_values = 2 * stats.t.sf(np.abs(t_stat), np.maximum(dof, 1))
+
+        # Each column's trend starts at its own first observation
+        first = mask.argmax(axis=0)
+        last = len(df) - 1 - mask[::-1].argmax(axis=0)
+        x_flat = x[:, 0]
+
+        results: dict[str, TrendResult] = {}
+        for j, column in enumerate(df.columns):
+            if n[j] < 7:
+                continue
+
+            start_value = intercept[j] + slope[j] * x_flat[first[j]]
+            end_value = intercept[j] + slope[j] * x_flat[last[j]]
+            if start_value != 0:
+                percent_change = ((end_value - start_value) / abs(start_value)) * 100
+            else:
+                percent_change = 0
+
+            is_significant = bool(p_values[j] < self.alpha)
+            if is_significant:
+                direction = "increasing" if slope[j] > 0 else "decreasing"
+            else:
+                direction = "stable"
+
+            results[str(column)] = TrendResult(
+                biomarker=str(column),
+                start_date=df.index[first[j]],
+                end_date=df.index[last[j]],
+                slope=float(slope[j]),
+                slope_per_day=float(slope[j]),
+                r_squared=float(r[j] ** 2),
+                p_value=float(p_values[j]),
+                direction=direction,
+                is_significant=is_significant,
+                percent_change=float(percent_change),
+            )
+
+        return results
+
     def detect_change_points(
         self,
         data: pd.Series,
@@ -1,17 +1,30 @@
 """Data loading utilities for analytics"""
 
-from datetime import datetime
+import asyncio
+from collections.abc import Awaitable
+from datetime import datetime, timedelta
 
 import pandas as pd
-from sqlalchemy import select
+from sqlalchemy import TableClause, func, select
+from sqlalchemy.exc import ProgrammingError
 
-from myome.core.database import get_session_context
+from myome.core.database import get_read_session_context
+from myome.core.logging import logger
 from myome.core.models import (
     GlucoseReading,
     HeartRateReading,
     HRVReading,
     SleepSession,
 )
+from myome.core.models.time_series import glucose_daily, heart_rate_daily, hrv_daily
+
+# Resampling frequency served from the daily rollups instead of raw readings
+DAILY = "1D"
+
+
+async def _no_data() -> pd.DataFrame:
+    """Stand-in for a load that is not needed"""
+    return pd.DataFrame()
 
 
 class TimeSeriesLoader:
@@ -20,6 +33,49 @@ class TimeSeriesLoader:
     def __init__(self, user_id: str):
         self.user_id = user_id
 
+    async def _load_daily(
+        self,
+        rollup: TableClause,
+        start: datetime,
+        end: datetime,
+    ) -> pd.DataFrame | None:
+        """
+        Load daily averages from a continuous aggregate.
+
+        Returns a frame shaped like the raw readings resampled to one day, or
+        None when there is no data in range or the rollup is unavailable.
+        """
+        columns = [c.name for c in rollup.c if c.name not in ("user_id", "day")]
+        try:
+            async with get_read_session_context() as session:
+                result = await session.execute(
+                    select(rollup.c.day, *(rollup.c[c] for c in columns))
+                    .where(
+                        rollup.c.user_id == self.user_id,
+                        rollup.c.day >= func.time_bucket(timedelta(days=1), start),
+                        rollup.c.day <= end,
+                    )
+                    .order_by(rollup.c.day)
+                )
+                rows = result.all()
+        except ProgrammingError as e:
+            # Rollups come from migrations and need TimescaleDB; schemas built
+            # without them fall back to resampling raw readings
+            logger.warning(f"Daily rollup {rollup.name} unavailable: {e.orig}")
+            return None
+
+        if not rows:
+            return None
+
+        df = pd.DataFrame(
+            [row[1:] for row in rows],
+            index=pd.DatetimeIndex([row[0] for row in rows], name="timestamp"),
+            columns=columns,
+            dtype="float64",
+        )
+        # Days without readings become NaN rows, as with resample
+        return df.asfreq(DAILY)
+
     async def load_heart_rate(
         self,
         start: datetime,
@@ -34,9 +90,19 @@ class TimeSeriesLoader:
             end: End datetime
             resample: Optional resampling frequency (e.g., '1H', '1D')
         """
-        async with get_session_context() as session:
+        if resample == DAILY:
+            daily = await self._load_daily(heart_rate_daily, start, end)
+            if daily is not None:
+                return daily
+
+        async with get_read_session_context() as session:
+            # Select only the columns the frame uses, not full ORM rows
             query = (
-                select(HeartRateReading)
+                select(
+                    HeartRateReading.timestamp,
+                    HeartRateReading.heart_rate_bpm,
+                    HeartRateReading.confidence,
+                )
                 .where(
                     HeartRateReading.user_id == self.user_id,
                     HeartRateReading.timestamp >= start,
@@ -46,21 +112,12 @@ class TimeSeriesLoader:
             )
 
             result = await session.execute(query)
-            readings = result.scalars().all()
+            rows = result.all()
 
-        if not readings:
+        if not rows:
             return pd.DataFrame(columns=["timestamp", "heart_rate_bpm"])
 
-        df = pd.DataFrame(
-            [
-                {
-                    "timestamp": r.timestamp,
-                    "heart_rate_bpm": r.heart_rate_bpm,
-                    "confidence": r.confidence,
-                }
-                for r in readings
-            ]
-        )
+        df = pd.DataFrame(rows, columns=["timestamp", "heart_rate_bpm", "confidence"])
 
         df.set_index("timestamp", inplace=True)
 
@@ -81,9 +138,18 @@ class TimeSeriesLoader:
         resample: str | None = None,
     ) -> pd.DataFrame:
         """Load glucose data as pandas DataFrame"""
-        async with get_session_context() as session:
+        if resample == DAILY:
+            daily = await self._load_daily(glucose_daily, start, end)
+            if daily is not None:
+                return daily
+
+        async with get_read_session_context() as session:
             query = (
-                select(GlucoseReading)
+                select(
+                    GlucoseReading.timestamp,
+                    GlucoseReading.glucose_mg_dl,
+                    GlucoseReading.trend,
+                )
                 .where(
                     GlucoseReading.user_id == self.user_id,
                     GlucoseReading.timestamp >= start,
@@ -93,21 +159,12 @@ class TimeSeriesLoader:
             )
 
             result = await session.execute(query)
-            readings = result.scalars().all()
+            rows = result.all()
 
-        if not readings:
+        if not rows:
             return pd.DataFrame(columns=["timestamp", "glucose_mg_dl"])
 
-        df = pd.DataFrame(
-            [
-                {
-                    "timestamp": r.timestamp,
-                    "glucose_mg_dl": r.glucose_mg_dl,
-                    "trend": r.trend,
-                }
-                for r in readings
-            ]
-        )
+        df = pd.DataFrame(rows, columns=["timestamp", "glucose_mg_dl", "trend"])
 
         df.set_index("timestamp", inplace=True)
 
@@ -127,9 +184,20 @@ class TimeSeriesLoader:
         resample: str | None = None,
     ) -> pd.DataFrame:
         """Load HRV data as pandas DataFrame"""
-        async with get_session_context() as session:
+        if resample == DAILY:
+            daily = await self._load_daily(hrv_daily, start, end)
+            if daily is not None:
+                return daily
+
+        async with get_read_session_context() as session:
             query = (
-                select(HRVReading)
+                select(
+                    HRVReading.timestamp,
+                    HRVReading.sdnn_ms,
+                    HRVReading.rmssd_ms,
+                    HRVReading.pnn50_pct,
+                    HRVReading.lf_hf_ratio,
+                )
                 .where(
                     HRVReading.user_id == self.user_id,
                     HRVReading.timestamp >= start,
@@ -139,22 +207,14 @@ class TimeSeriesLoader:
             )
 
             result = await session.execute(query)
-            readings = result.scalars().all()
+            rows = result.all()
 
-        if not readings:
+        if not rows:
             return pd.DataFrame(columns=["timestamp", "sdnn_ms", "rmssd_ms"])
 
         df = pd.DataFrame(
-            [
-                {
-                    "timestamp": r.timestamp,
-                    "sdnn_ms": r.sdnn_ms,
-                    "rmssd_ms": r.rmssd_ms,
-                    "pnn50_pct": r.pnn50_pct,
-                    "lf_hf_ratio": r.lf_hf_ratio,
-                }
-                for r in readings
-            ]
+            rows,
+            columns=["timestamp", "sdnn_ms", "rmssd_ms", "pnn50_pct", "lf_hf_ratio"],
         )
 
         df.set_index("timestamp", inplace=True)
@@ -170,7 +230,7 @@ class TimeSeriesLoader:
         end: datetime,
     ) -> pd.DataFrame:
         """Load sleep session data"""
-        async with get_session_context() as session:
+        async with get_read_session_context() as session:
             query = (
                 select(SleepSession)
                 .where(
@@ -219,11 +279,25 @@ class TimeSeriesLoader:
 
         Returns DataFrame with columns for each biomarker
         """
-        # Load each data type
-        hr_df = await self.load_heart_rate(start, end, resample)
-        glucose_df = await self.load_glucose(start, end, resample)
-        hrv_df = await self.load_hrv(start, end, resample)
-        sleep_df = await self.load_sleep(start, end)
+        wants_hrv = "hrv_sdnn" in biomarkers or "hrv_rmssd" in biomarkers
+        wants_sleep = any(b.startswith("sleep_") for b in biomarkers)
+
+        # Load only the data types requested, concurrently
+        loads: list[Awaitable[pd.DataFrame]] = [
+            (
+                self.load_heart_rate(start, end, resample)
+                if "heart_rate" in biomarkers
+                else _no_data()
+            ),
+            (
+                self.load_glucose(start, end, resample)
+                if "glucose" in biomarkers
+                else _no_data()
+            ),
+            self.load_hrv(start, end, resample) if wants_hrv else _no_data(),
+            self.load_sleep(start, end) if wants_sleep else _no_data(),
+        ]
+        hr_df, glucose_df, hrv_df, sleep_df = await asyncio.gather(*loads)
 
         # Combine into single DataFrame
         dfs = []
@@ -261,7 +335,7 @@ class TimeSeriesLoader:
             combined = combined.join(df, how="outer")
 
         # Handle sleep data (daily, needs special treatment)
-        if any(b.startswith("sleep_") for b in biomarkers) and not sleep_df.empty:
+        if wants_sleep and not sleep_df.empty:
             sleep_df.index = pd.to_datetime(sleep_df.index)
             combined = combined.join(sleep_df, how="outer")
 
@@ -1,10 +1,17 @@
 """API dependencies"""
 
-from myome.api.deps.auth import CurrentUser, get_current_user
+from myome.api.deps.auth import (
+    CurrentUser,
+    CurrentUserWithProfile,
+    get_current_user,
+    get_current_user_with_profile,
+)
 from myome.api.deps.db import DbSession
 
 __all__ = [
     "get_current_user",
+    "get_current_user_with_profile",
     "CurrentUser",
+    "CurrentUserWithProfile",
     "DbSession",
 ]
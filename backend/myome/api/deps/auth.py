@@ -6,6 +6,8 @@ from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from sqlalchemy.sql.base import ExecutableOption
 
 from myome.api.auth import verify_access_token
 from myome.core.database import get_session
@@ -15,11 +17,12 @@ from myome.core.models import User
 security = HTTPBearer()
 
 
-async def get_current_user(
-    credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
-    session: Annotated[AsyncSession, Depends(get_session)],
+async def _load_current_user(
+    credentials: HTTPAuthorizationCredentials,
+    session: AsyncSession,
+    *options: ExecutableOption,
 ) -> User:
-    """Get current authenticated user from token"""
+    """Resolve the token's user, applying any loader options"""
     try:
         user_id = verify_access_token(credentials.credentials)
     except AuthenticationException as e:
@@ -30,7 +33,9 @@ async def get_current_user(
         )
 
     # Get user from database
-    result = await session.execute(select(User).where(User.id == user_id))
+    result = await session.execute(
+        select(User).options(*options).where(User.id == user_id)
+    )
     user = result.scalar_one_or_none()
 
     if user is None:
@@ -48,5 +53,24 @@ async def get_current_user(
     return user
 
 
+async def get_current_user(
+    credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
+    session: Annotated[AsyncSession, Depends(get_session)],
+) -> User:
+    """Get current authenticated user from token"""
+    return await _load_current_user(credentials, session)
+
+
+async def get_current_user_with_profile(
+    credentials: Annotated[HTTPAuthorizationCredentials, Depends(security)],
+    session: Annotated[AsyncSession, Depends(get_session)],
+) -> User:
+    """Get current user with health profile loaded in the same query"""
+    return await _load_current_user(
+        credentials, session, joinedload(User.health_profile)
+    )
+
+
 # Type alias for dependency injection
 CurrentUser = Annotated[User, Depends(get_current_user)]
+CurrentUserWithProfile = Annotated[User, Depends(get_current_user_with_profile)]
@@ -5,6 +5,7 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
 
 from myome.api.routes import (
@@ -19,6 +20,7 @@ from myome.api.routes import (
 )
 from myome.core.config import settings
 from myome.core.exceptions import MyomeException
+from myome.core.http import close_http_client
 from myome.core.logging import logger
 
 
@@ -32,6 +34,7 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     yield
     # Shutdown
     logger.info("Shutting down application")
+    await close_http_client()
 
 
 app = FastAPI(
@@ -67,6 +70,10 @@ else:
         allow_headers=["*"],
     )
 
+# Compress larger JSON payloads (risk reports, readings, FHIR bundles);
+# small responses are not worth the CPU
+app.add_middleware(GZipMiddleware, minimum_size=1000)
+
 
 # Exception handlers
 @app.exception_handler(MyomeException)
@@ -0,0 +1,27 @@
+"""API response classes"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    Routes return it directly so FastAPI skips jsonable_encoder; datetimes,
+    UUIDs and numpy scalars are serialized natively.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
+
+
+class FHIRJSONResponse(ORJSONResponse):
+    """FHIR resource rendered with orjson under the FHIR JSON media type"""
+
+    media_type = "application/fhir+json"
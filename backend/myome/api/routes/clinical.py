@@ -1,28 +1,76 @@
 """Clinical integration API routes"""
 
+from collections.abc import Callable
 from datetime import UTC, datetime, timedelta
+from itertools import islice
+from typing import TYPE_CHECKING, Any
 
 from fastapi import APIRouter, HTTPException, Query
 
 from myome.api.deps.auth import CurrentUser
 from myome.api.deps.db import DbSession
+from myome.api.responses import FHIRJSONResponse, ORJSONResponse
 from myome.clinical.fhir.resources import FHIRResourceGenerator
 from myome.clinical.reports.generator import PhysicianReportGenerator
+from myome.core.cache import cache_key, get_or_compute
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 router = APIRouter(prefix="/clinical", tags=["Clinical Integration"])
 
+# Response cache TTL for physician reports (seconds)
+REPORT_CACHE_TTL = 900
+
+# Maximum resources in an exported FHIR Bundle
+BUNDLE_MAX_RESOURCES = 100
+
+
+def _frame_observations(
+    df: "pd.DataFrame",
+    column: str,
+    factory: Callable[[Any, datetime], dict],
+    cast: Callable[[Any], Any] = float,
+    limit: int | None = None,
+) -> list[dict]:
+    """Build FHIR observations from one column of a time-indexed frame"""
+    if df.empty or column not in df.columns or limit == 0:
+        return []
+
+    # Convert timestamps and values once instead of per row
+    timestamps = df.index.to_pydatetime()
+    values = df[column].to_numpy()
+    present = df.notna().any(axis=1).to_numpy()
 
-@router.get("/report")
+    observations = (
+        factory(cast(values[i]), timestamps[i]) for i in range(len(df)) if present[i]
+    )
+    return list(islice(observations, limit))
+
+
+@router.get("/report", response_class=ORJSONResponse)
 async def generate_physician_report(
     user: CurrentUser,
     session: DbSession,
     report_date: datetime | None = Query(default=None),
     months: int = Query(default=3, ge=1, le=12),
-) -> dict:
+) -> ORJSONResponse:
     """Generate comprehensive physician report"""
-    generator = PhysicianReportGenerator(user.id)
-    report = await generator.generate_report(report_date, months)
-    return report
+    key = cache_key(
+        user.id,
+        "clinical:report",
+        report_date.isoformat() if report_date else "latest",
+        months,
+    )
+    report = await get_or_compute(
+        user.id,
+        key,
+        REPORT_CACHE_TTL,
+        lambda: PhysicianReportGenerator(user.id).generate_report(report_date, months),
+    )
+    # Reports carry many floats and NumPy scalars; render them with orjson
+    # rather than jsonable_encoder and json.dumps
+    return ORJSONResponse(report)
 
 
 @router.get("/report/pdf")
@@ -40,25 +88,27 @@ async def generate_physician_report_pdf(
     )
 
 
-@router.get("/fhir/Patient")
+@router.get("/fhir/Patient", response_class=FHIRJSONResponse)
 async def get_fhir_patient(
     user: CurrentUser,
-) -> dict:
+) -> FHIRJSONResponse:
     """Get patient data as FHIR Patient resource"""
     generator = FHIRResourceGenerator(user.id)
-    return generator.create_patient(
-        {
-            "first_name": user.first_name,
-            "last_name": user.last_name,
-            "date_of_birth": (
-                user.date_of_birth.isoformat() if user.date_of_birth else None
-            ),
-            "biological_sex": user.biological_sex,
-        }
+    return FHIRJSONResponse(
+        generator.create_patient(
+            {
+                "first_name": user.first_name,
+                "last_name": user.last_name,
+                "date_of_birth": (
+                    user.date_of_birth.isoformat() if user.date_of_birth else None
+                ),
+                "biological_sex": user.biological_sex,
+            }
+        )
     )
 
 
-@router.get("/fhir/Bundle")
+@router.get("/fhir/Bundle", response_class=FHIRJSONResponse)
 async def get_fhir_bundle(
     user: CurrentUser,
     session: DbSession,
@@ -71,7 +121,7 @@ async def get_fhir_bundle(
         default=True, description="Include glucose observations"
     ),
     include_hrv: bool = Query(default=True, description="Include HRV observations"),
-) -> dict:
+) -> FHIRJSONResponse:
     """Export health data as FHIR Bundle"""
     from myome.analytics.data_loader import TimeSeriesLoader
 
@@ -99,60 +149,54 @@ async def get_fhir_bundle(
         )
     )
 
+    # Only build observations that still fit in the bundle, and skip
+    # loading series once it is full
+    def remaining() -> int:
+        return BUNDLE_MAX_RESOURCES - len(resources)
+
     # Add heart rate observations
-    if include_hr:
+    if include_hr and remaining():
         hr_df = await loader.load_heart_rate(start, end, resample="1H")
-        for idx, row in hr_df.iterrows():
-            if not row.isna().all():
-                timestamp = (
-                    idx.to_pydatetime() if hasattr(idx, "to_pydatetime") else idx
-                )
-                resources.append(
-                    fhir.create_heart_rate_observation(
-                        int(row["heart_rate_bpm"]),
-                        timestamp,
-                    )
-                )
+        resources.extend(
+            _frame_observations(
+                hr_df,
+                "heart_rate_bpm",
+                fhir.create_heart_rate_observation,
+                int,
+                limit=remaining(),
+            )
+        )
 
     # Add glucose observations
-    if include_glucose:
+    if include_glucose and remaining():
         glucose_df = await loader.load_glucose(start, end, resample="1H")
-        for idx, row in glucose_df.iterrows():
-            if not row.isna().all():
-                timestamp = (
-                    idx.to_pydatetime() if hasattr(idx, "to_pydatetime") else idx
-                )
-                resources.append(
-                    fhir.create_glucose_observation(
-                        float(row["glucose_mg_dl"]),
-                        timestamp,
-                    )
-                )
+        resources.extend(
+            _frame_observations(
+                glucose_df,
+                "glucose_mg_dl",
+                fhir.create_glucose_observation,
+                limit=remaining(),
+            )
+        )
 
     # Add HRV observations
-    if include_hrv:
+    if include_hrv and remaining():
         hrv_df = await loader.load_hrv(start, end, resample="1H")
-        for idx, row in hrv_df.iterrows():
-            if "sdnn_ms" in row and not row.isna().all():
-                timestamp = (
-                    idx.to_pydatetime() if hasattr(idx, "to_pydatetime") else idx
-                )
-                resources.append(
-                    fhir.create_hrv_observation(
-                        float(row["sdnn_ms"]),
-                        timestamp,
-                    )
-                )
-
-    return fhir.create_bundle(resources[:100])  # Limit to 100 resources
-
-
-@router.get("/fhir/DiagnosticReport")
+        resources.extend(
+            _frame_observations(
+                hrv_df, "sdnn_ms", fhir.create_hrv_observation, limit=remaining()
+            )
+        )
+
+    return FHIRJSONResponse(fhir.create_bundle(resources))
+
+
+@router.get("/fhir/DiagnosticReport", response_class=FHIRJSONResponse)
 async def get_fhir_diagnostic_report(
     user: CurrentUser,
     session: DbSession,
     months: int = Query(default=3, ge=1, le=12),
-) -> dict:
+) -> FHIRJSONResponse:
     """Generate FHIR DiagnosticReport from physician report"""
     report_gen = PhysicianReportGenerator(user.id)
     fhir_gen = FHIRResourceGenerator(user.id)
@@ -192,10 +236,10 @@ async def get_fhir_diagnostic_report(
             )
         )
 
-    return fhir_gen.create_diagnostic_report(report, observations)
+    return FHIRJSONResponse(fhir_gen.create_diagnostic_report(report, observations))
 
 
-@router.get("/fhir/Observation/{observation_type}")
+@router.get("/fhir/Observation/{observation_type}", response_class=FHIRJSONResponse)
 async def get_fhir_observations(
     observation_type: str,
     user: CurrentUser,
@@ -203,7 +247,7 @@ async def get_fhir_observations(
     start: datetime | None = Query(default=None),
     end: datetime | None = Query(default=None),
     limit: int = Query(default=50, le=200),
-) -> dict:
+) -> FHIRJSONResponse:
     """Get observations of a specific type as FHIR resources"""
     from myome.analytics.data_loader import TimeSeriesLoader
 
@@ -215,49 +259,25 @@ async def get_fhir_observations(
     loader = TimeSeriesLoader(user.id)
     fhir = FHIRResourceGenerator(user.id)
 
-    observations = []
+    observations: list[dict] = []
 
     if observation_type == "heart-rate":
         df = await loader.load_heart_rate(start, end)
-        for idx, row in df.head(limit).iterrows():
-            if not row.isna().all():
-                timestamp = (
-                    idx.to_pydatetime() if hasattr(idx, "to_pydatetime") else idx
-                )
-                observations.append(
-                    fhir.create_heart_rate_observation(
-                        int(row["heart_rate_bpm"]),
-                        timestamp,
-                    )
-                )
+        observations = _frame_observations(
+            df.head(limit), "heart_rate_bpm", fhir.create_heart_rate_observation, int
+        )
 
     elif observation_type == "glucose":
         df = await loader.load_glucose(start, end)
-        for idx, row in df.head(limit).iterrows():
-            if not row.isna().all():
-                timestamp = (
-                    idx.to_pydatetime() if hasattr(idx, "to_pydatetime") else idx
-                )
-                observations.append(
-                    fhir.create_glucose_observation(
-                        float(row["glucose_mg_dl"]),
-                        timestamp,
-                    )
-                )
+        observations = _frame_observations(
+            df.head(limit), "glucose_mg_dl", fhir.create_glucose_observation
+        )
 
     elif observation_type == "hrv":
         df = await loader.load_hrv(start, end)
-        for idx, row in df.head(limit).iterrows():
-            if "sdnn_ms" in row and not row.isna().all():
-                timestamp = (
-                    idx.to_pydatetime() if hasattr(idx, "to_pydatetime") else idx
-                )
-                observations.append(
-                    fhir.create_hrv_observation(
-                        float(row["sdnn_ms"]),
-                        timestamp,
-                    )
-                )
+        observations = _frame_observations(
+            df.head(limit), "sdnn_ms", fhir.create_hrv_observation
+        )
 
     else:
         raise HTTPException(
@@ -265,4 +285,4 @@ async def get_fhir_observations(
             detail=f"Unknown observation type: {observation_type}. Supported: heart-rate, glucose, hrv",
         )
 
-    return fhir.create_bundle(observations)
+    return FHIRJSONResponse(fhir.create_bundle(observations))
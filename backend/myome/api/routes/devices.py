@@ -2,12 +2,16 @@
 
 from datetime import UTC, datetime
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, BackgroundTasks, HTTPException, status
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from myome.api.deps.auth import CurrentUser
 from myome.api.deps.db import DbSession
+from myome.core.database import async_session_factory
+from myome.core.logging import logger
 from myome.core.models import Device, DeviceType, DeviceVendor
 
 router = APIRouter(prefix="/devices", tags=["Devices"])
@@ -43,6 +47,39 @@ class DeviceSyncRequest(BaseModel):
     hours_back: int = 24
 
 
+async def _get_user_device(
+    session: AsyncSession,
+    device_id: str,
+    user_id: str,
+) -> Device:
+    """Load a device by primary key, ensuring it belongs to the user"""
+    # Primary-key lookup hits the identity map before emitting SQL
+    device = await session.get(Device, device_id)
+
+    if device is None or device.user_id != user_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Device not found",
+        )
+
+    return device
+
+
+async def _update_sync_time(device_id: str) -> None:
+    """Record a device's last sync time after the response is sent"""
+    async with async_session_factory() as session:
+        try:
+            await session.execute(
+                update(Device)
+                .where(Device.id == device_id)
+                .values(last_sync_at=datetime.now(UTC))
+            )
+            await session.commit()
+        except Exception as e:
+            logger.error(f"Failed to update sync time for device {device_id}: {e}")
+            await session.rollback()
+
+
 @router.get("/", response_model=list[DeviceRead])
 async def list_devices(
     user: CurrentUser,
@@ -51,7 +88,20 @@ async def list_devices(
     """List user's connected devices"""
     result = await session.execute(select(Device).where(Device.user_id == user.id))
     devices = result.scalars().all()
-    return [DeviceRead.model_validate(d) for d in devices]
+
+    # Rows come from the database and are trusted; skip re-validation
+    return [
+        DeviceRead.model_construct(
+            id=d.id,
+            name=d.name,
+            device_type=d.device_type,
+            vendor=d.vendor,
+            model=d.model,
+            is_connected=d.is_connected,
+            last_sync_at=d.last_sync_at,
+        )
+        for d in devices
+    ]
 
 
 @router.post("/", response_model=DeviceRead, status_code=status.HTTP_201_CREATED)
@@ -70,7 +120,15 @@ async def add_device(
         api_credentials=device_data.api_credentials or {},
     )
     session.add(device)
-    await session.commit()
+    try:
+        await session.commit()
+    except IntegrityError as e:
+        # OAuth vendors are limited to one device per user
+        await session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"A {device_data.vendor.value} device is already connected",
+        ) from e
     await session.refresh(device)
 
     return DeviceRead.model_validate(device)
@@ -83,19 +141,7 @@ async def get_device(
     session: DbSession,
 ) -> DeviceRead:
     """Get device details"""
-    result = await session.execute(
-        select(Device).where(
-            Device.id == device_id,
-            Device.user_id == user.id,
-        )
-    )
-    device = result.scalar_one_or_none()
-
-    if not device:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Device not found",
-        )
+    device = await _get_user_device(session, device_id, user.id)
 
     return DeviceRead.model_validate(device)
 
@@ -107,19 +153,7 @@ async def delete_device(
     session: DbSession,
 ) -> None:
     """Delete a device"""
-    result = await session.execute(
-        select(Device).where(
-            Device.id == device_id,
-            Device.user_id == user.id,
-        )
-    )
-    device = result.scalar_one_or_none()
-
-    if not device:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Device not found",
-        )
+    device = await _get_user_device(session, device_id, user.id)
 
     await session.delete(device)
     await session.commit()
@@ -131,30 +165,18 @@ async def sync_device(
     sync_request: DeviceSyncRequest,
     user: CurrentUser,
     session: DbSession,
+    background: BackgroundTasks,
 ) -> dict:
     """Trigger device sync"""
-    result = await session.execute(
-        select(Device).where(
-            Device.id == device_id,
-            Device.user_id == user.id,
-        )
-    )
-    device = result.scalar_one_or_none()
-
-    if not device:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Device not found",
-        )
+    await _get_user_device(session, device_id, user.id)
 
     # Trigger async sync via Celery
     from myome.sensors.tasks import sync_user_devices
 
     task = sync_user_devices.delay(user.id, sync_request.hours_back)
 
-    # Update last sync time
-    device.last_sync_at = datetime.now(UTC)
-    await session.commit()
+    # Update last sync time off the request path
+    background.add_task(_update_sync_time, device_id)
 
     return {
         "status": "sync_started",
@@ -1,31 +1,46 @@
 """Health data routes"""
 
 from datetime import UTC, datetime, timedelta
+from functools import lru_cache
+from typing import Any
 
-from fastapi import APIRouter, Query, status
-from pydantic import BaseModel
-from sqlalchemy import select
+from fastapi import APIRouter, Body, Query, status
+from pydantic import BaseModel, Field
+from sqlalchemy import DateTime, bindparam, insert, or_, select
+from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.sql import Select
 
+from myome.analytics.correlation import CorrelationEngine, TrendAnalyzer
+from myome.analytics.data_loader import TimeSeriesLoader
 from myome.analytics.service import AnalyticsService
 from myome.api.deps.auth import CurrentUser
 from myome.api.deps.db import DbSession
+from myome.core.cache import cache_key, get_or_compute, invalidate_user
 from myome.core.models import (
     BodyComposition,
     GlucoseReading,
     HeartRateReading,
     SleepSession,
 )
+from myome.core.models.mixins import uuid7
 
 router = APIRouter(prefix="/health", tags=["Health Data"])
 
+# Upper bound on readings accepted by a single bulk request
+MAX_BULK_READINGS = 5000
+
+# Response cache TTLs for analytics endpoints (seconds)
+ANALYTICS_CACHE_TTL = 300
+CORRELATIONS_CACHE_TTL = 1800
+
 
 class HeartRateCreate(BaseModel):
     """Heart rate creation request"""
 
     timestamp: datetime
-    heart_rate_bpm: int
+    heart_rate_bpm: int = Field(..., ge=20, le=300)
     activity_type: str | None = None
-    confidence: float | None = None
+    confidence: float | None = Field(None, ge=0, le=1)
     device_id: str | None = None
 
 
@@ -45,7 +60,7 @@ class GlucoseCreate(BaseModel):
     """Glucose creation request"""
 
     timestamp: datetime
-    glucose_mg_dl: float
+    glucose_mg_dl: float = Field(..., ge=20, le=600)
     trend: str | None = None
     meal_context: str | None = None
     device_id: str | None = None
@@ -97,6 +112,12 @@ class BloodPressureCreate(BaseModel):
     device_id: str | None = None
 
 
+class BulkInsertResponse(BaseModel):
+    """Bulk insert response"""
+
+    inserted: int
+
+
 class SleepCreate(BaseModel):
     """Sleep session creation request"""
 
@@ -110,6 +131,35 @@ class SleepCreate(BaseModel):
     device_id: str | None = None
 
 
+def _windowed_select(
+    model: type[Any],
+    time_column: InstrumentedAttribute[datetime],
+    user_id: str,
+    start: datetime | None,
+    end: datetime | None,
+    limit: int,
+) -> Select:
+    """
+    Build a user-scoped, time-windowed select with a constant statement shape.
+
+    Optional bounds are bound as typed (possibly NULL) parameters instead of
+    conditionally chained, so every request reuses one compiled-cache entry.
+    """
+    start_param = bindparam("start", start, type_=DateTime(timezone=True))
+    end_param = bindparam("end", end, type_=DateTime(timezone=True))
+
+    return (
+        select(model)
+        .where(
+            model.user_id == user_id,
+            or_(start_param.is_(None), time_column >= start_param),
+            or_(end_param.is_(None), time_column <= end_param),
+        )
+        .order_by(time_column.desc())
+        .limit(limit)
+    )
+
+
 # ============== Heart Rate ==============
 
 
@@ -122,19 +172,24 @@ async def get_heart_rate(
     limit: int = Query(default=1000, le=10000),
 ) -> list[HeartRateRead]:
     """Get heart rate readings"""
-    query = select(HeartRateReading).where(HeartRateReading.user_id == user.id)
-
-    if start:
-        query = query.where(HeartRateReading.timestamp >= start)
-    if end:
-        query = query.where(HeartRateReading.timestamp <= end)
-
-    query = query.order_by(HeartRateReading.timestamp.desc()).limit(limit)
+    query = _windowed_select(
+        HeartRateReading, HeartRateReading.timestamp, user.id, start, end, limit
+    )
 
     result = await session.execute(query)
     readings = result.scalars().all()
 
-    return [HeartRateRead.model_validate(r) for r in readings]
+    # Rows come from the database and are trusted; skip re-validation
+    return [
+        HeartRateRead.model_construct(
+            timestamp=r.timestamp,
+            heart_rate_bpm=r.heart_rate_bpm,
+            activity_type=r.activity_type,
+            confidence=r.confidence,
+            device_id=r.device_id,
+        )
+        for r in readings
+    ]
 
 
 @router.post("/heart-rate", status_code=status.HTTP_201_CREATED)
@@ -154,11 +209,43 @@ async def add_heart_rate(
     )
     session.add(hr)
     await session.commit()
+    await invalidate_user(user.id)
     await session.refresh(hr)
 
     return HeartRateRead.model_validate(hr)
 
 
+@router.post("/heart-rate/bulk", status_code=status.HTTP_201_CREATED)
+async def add_heart_rate_bulk(
+    user: CurrentUser,
+    session: DbSession,
+    readings: list[HeartRateCreate] = Body(..., max_length=MAX_BULK_READINGS),
+) -> BulkInsertResponse:
+    """
+    Add a batch of heart rate readings in a single transaction.
+    Preferred over the single-reading endpoint for device syncs.
+    """
+    if not readings:
+        return BulkInsertResponse(inserted=0)
+
+    rows = [
+        {
+            "timestamp": r.timestamp,
+            "user_id": user.id,
+            "heart_rate_bpm": r.heart_rate_bpm,
+            "activity_type": r.activity_type,
+            "confidence": r.confidence,
+            "device_id": r.device_id,
+        }
+        for r in readings
+    ]
+    await session.execute(insert(HeartRateReading), rows)
+    await session.commit()
+    await invalidate_user(user.id)
+
+    return BulkInsertResponse(inserted=len(rows))
+
+
 # ============== Glucose ==============
 
 
@@ -171,19 +258,24 @@ async def get_glucose(
     limit: int = Query(default=1000, le=10000),
 ) -> list[GlucoseRead]:
     """Get glucose readings"""
-    query = select(GlucoseReading).where(GlucoseReading.user_id == user.id)
-
-    if start:
-        query = query.where(GlucoseReading.timestamp >= start)
-    if end:
-        query = query.where(GlucoseReading.timestamp <= end)
-
-    query = query.order_by(GlucoseReading.timestamp.desc()).limit(limit)
+    query = _windowed_select(
+        GlucoseReading, GlucoseReading.timestamp, user.id, start, end, limit
+    )
 
     result = await session.execute(query)
     readings = result.scalars().all()
 
-    return [GlucoseRead.model_validate(r) for r in readings]
+    # Rows come from the database and are trusted; skip re-validation
+    return [
+        GlucoseRead.model_construct(
+            timestamp=r.timestamp,
+            glucose_mg_dl=r.glucose_mg_dl,
+            trend=r.trend,
+            meal_context=r.meal_context,
+            device_id=r.device_id,
+        )
+        for r in readings
+    ]
 
 
 @router.post("/glucose", status_code=status.HTTP_201_CREATED)
@@ -203,11 +295,43 @@ async def add_glucose(
     )
     session.add(glucose)
     await session.commit()
+    await invalidate_user(user.id)
     await session.refresh(glucose)
 
     return GlucoseRead.model_validate(glucose)
 
 
+@router.post("/glucose/bulk", status_code=status.HTTP_201_CREATED)
+async def add_glucose_bulk(
+    user: CurrentUser,
+    session: DbSession,
+    readings: list[GlucoseCreate] = Body(..., max_length=MAX_BULK_READINGS),
+) -> BulkInsertResponse:
+    """
+    Add a batch of glucose readings in a single transaction.
+    Preferred over the single-reading endpoint for CGM syncs.
+    """
+    if not readings:
+        return BulkInsertResponse(inserted=0)
+
+    rows = [
+        {
+            "timestamp": r.timestamp,
+            "user_id": user.id,
+            "glucose_mg_dl": r.glucose_mg_dl,
+            "trend": r.trend,
+            "meal_context": r.meal_context,
+            "device_id": r.device_id,
+        }
+        for r in readings
+    ]
+    await session.execute(insert(GlucoseReading), rows)
+    await session.commit()
+    await invalidate_user(user.id)
+
+    return BulkInsertResponse(inserted=len(rows))
+
+
 # ============== Body Composition ==============
 
 
@@ -220,19 +344,24 @@ async def get_body_composition(
     limit: int = Query(default=100, le=1000),
 ) -> list[BodyCompositionRead]:
     """Get body composition readings"""
-    query = select(BodyComposition).where(BodyComposition.user_id == user.id)
-
-    if start:
-        query = query.where(BodyComposition.timestamp >= start)
-    if end:
-        query = query.where(BodyComposition.timestamp <= end)
-
-    query = query.order_by(BodyComposition.timestamp.desc()).limit(limit)
+    query = _windowed_select(
+        BodyComposition, BodyComposition.timestamp, user.id, start, end, limit
+    )
 
     result = await session.execute(query)
     readings = result.scalars().all()
 
-    return [BodyCompositionRead.model_validate(r) for r in readings]
+    # Rows come from the database and are trusted; skip re-validation
+    return [
+        BodyCompositionRead.model_construct(
+            timestamp=r.timestamp,
+            weight_kg=r.weight_kg,
+            body_fat_pct=r.body_fat_pct,
+            muscle_mass_kg=r.muscle_mass_kg,
+            device_id=r.device_id,
+        )
+        for r in readings
+    ]
 
 
 @router.post("/body-composition", status_code=status.HTTP_201_CREATED)
@@ -254,6 +383,7 @@ async def add_body_composition(
     )
     session.add(body_comp)
     await session.commit()
+    await invalidate_user(user.id)
     await session.refresh(body_comp)
 
     return BodyCompositionRead.model_validate(body_comp)
@@ -283,6 +413,7 @@ async def add_blood_pressure(
     )
     session.add(hr)
     await session.commit()
+    await invalidate_user(user.id)
 
     return {
         "timestamp": reading.timestamp.isoformat(),
@@ -305,14 +436,9 @@ async def get_sleep_sessions(
     limit: int = Query(default=30, le=365),
 ) -> list[dict]:
     """Get sleep sessions"""
-    query = select(SleepSession).where(SleepSession.user_id == user.id)
-
-    if start:
-        query = query.where(SleepSession.start_time >= start)
-    if end:
-        query = query.where(SleepSession.start_time <= end)
-
-    query = query.order_by(SleepSession.start_time.desc()).limit(limit)
+    query = _windowed_select(
+        SleepSession, SleepSession.start_time, user.id, start, end, limit
+    )
 
     result = await session.execute(query)
     sessions = result.scalars().all()
@@ -342,10 +468,8 @@ async def add_sleep_session(
     session: DbSession,
 ) -> dict:
     """Add manual sleep session"""
-    from uuid import uuid4
-
     sleep = SleepSession(
-        id=str(uuid4()),
+        id=uuid7(),
         user_id=user.id,
         start_time=reading.start_time,
         end_time=reading.end_time,
@@ -358,6 +482,7 @@ async def add_sleep_session(
     )
     session.add(sleep)
     await session.commit()
+    await invalidate_user(user.id)
     await session.refresh(sleep)
 
     return {
@@ -371,6 +496,23 @@ async def add_sleep_session(
 
 # ============== Analytics ==============
 
+# Per-user analytics helpers hold only configuration, so they are shared across
+# requests. AnalyticsService is not: its AlertManager deduplicates against
+# alerts raised earlier, which must not leak between requests.
+_trend_analyzer = TrendAnalyzer()
+
+
+@lru_cache(maxsize=2048)
+def _loader(user_id: str) -> TimeSeriesLoader:
+    """Get shared time-series loader for a user"""
+    return TimeSeriesLoader(user_id)
+
+
+@lru_cache(maxsize=2048)
+def _correlation_engine(user_id: str) -> CorrelationEngine:
+    """Get shared correlation engine for a user"""
+    return CorrelationEngine(user_id)
+
 
 @router.get("/analytics/daily")
 async def get_daily_analysis(
@@ -378,8 +520,13 @@ async def get_daily_analysis(
     date: datetime | None = Query(default=None),
 ) -> dict:
     """Get daily health analysis"""
-    service = AnalyticsService(user.id)
-    return await service.run_daily_analysis(date)
+    key = cache_key(user.id, "analytics:daily", date.date() if date else "latest")
+    return await get_or_compute(
+        user.id,
+        key,
+        ANALYTICS_CACHE_TTL,
+        lambda: AnalyticsService(user.id).run_daily_analysis(date),
+    )
 
 
 @router.get("/analytics/score")
@@ -388,8 +535,13 @@ async def get_health_score(
     date: datetime | None = Query(default=None),
 ) -> dict:
     """Get overall health score"""
-    service = AnalyticsService(user.id)
-    return await service.get_health_score(date)
+    key = cache_key(user.id, "analytics:score", date.isoformat() if date else "latest")
+    return await get_or_compute(
+        user.id,
+        key,
+        ANALYTICS_CACHE_TTL,
+        lambda: AnalyticsService(user.id).get_health_score(date),
+    )
 
 
 @router.get("/analytics/correlations")
@@ -398,19 +550,22 @@ async def get_correlations(
     days: int = Query(default=30, le=365),
 ) -> list[dict]:
     """Discover biomarker correlations"""
-    from myome.analytics.correlation.engine import CorrelationEngine
 
-    engine = CorrelationEngine(user.id)
-    end = datetime.now(UTC)
-    start = end - timedelta(days=days)
+    async def _compute() -> list[dict]:
+        engine = _correlation_engine(user.id)
+        end = datetime.now(UTC)
+        start = end - timedelta(days=days)
 
-    correlations = await engine.discover_all_correlations(
-        biomarkers=["heart_rate", "hrv_sdnn", "glucose"],
-        start=start,
-        end=end,
-    )
+        correlations = await engine.discover_all_correlations(
+            biomarkers=["heart_rate", "hrv_sdnn", "glucose"],
+            start=start,
+            end=end,
+        )
 
-    return [c.to_dict() for c in correlations[:20]]
+        return [c.to_dict() for c in correlations[:20]]
+
+    key = cache_key(user.id, "analytics:correlations", days)
+    return await get_or_compute(user.id, key, CORRELATIONS_CACHE_TTL, _compute)
 
 
 @router.get("/analytics/trends")
@@ -419,26 +574,25 @@ async def get_trends(
     days: int = Query(default=30, le=365),
 ) -> list[dict]:
     """Get biomarker trends"""
-    from myome.analytics.correlation.trends import TrendAnalyzer
-    from myome.analytics.data_loader import TimeSeriesLoader
 
-    loader = TimeSeriesLoader(user.id)
-    analyzer = TrendAnalyzer()
+    async def _compute() -> list[dict]:
+        loader = _loader(user.id)
 
-    end = datetime.now(UTC)
-    start = end - timedelta(days=days)
+        end = datetime.now(UTC)
+        start = end - timedelta(days=days)
 
-    df = await loader.load_multi_biomarker(
-        start,
-        end,
-        biomarkers=["heart_rate", "hrv_sdnn", "glucose"],
-        resample="1D",
-    )
+        df = await loader.load_multi_biomarker(
+            start,
+            end,
+            biomarkers=["heart_rate", "hrv_sdnn", "glucose"],
+            resample="1D",
+        )
 
-    trends = []
-    for column in df.columns:
-        trend = analyzer.compute_trend(df[column], column)
-        if trend and trend.is_significant:
-            trends.append(trend.to_dict())
+        return [
+            trend.to_dict()
+            for trend in _trend_analyzer.compute_trends_batch(df).values()
+            if trend.is_significant
+        ]
 
-    return trends
+    key = cache_key(user.id, "analytics:trends", days)
+    return await get_or_compute(user.id, key, ANALYTICS_CACHE_TTL, _compute)
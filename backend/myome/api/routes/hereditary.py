@@ -1,20 +1,40 @@
 """Hereditary artifact and family health API routes"""
 
+import asyncio
 from datetime import datetime
-from typing import cast
-from uuid import uuid4
+from functools import lru_cache
+from typing import Any
 
 from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
-from sqlalchemy import select
+from sqlalchemy import (
+    ColumnElement,
+    Integer,
+    and_,
+    case,
+    column,
+    delete,
+    func,
+    insert,
+    literal,
+    select,
+    true,
+    update,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute, raiseload
 
 from myome.api.deps.auth import CurrentUser
 from myome.api.deps.db import DbSession
+from myome.api.responses import ORJSONResponse
+from myome.core.models import User
 from myome.hereditary.artifact import HereditaryArtifact, PrivacySettings
 from myome.hereditary.document_processor import FamilyDocumentProcessor
-from myome.hereditary.models import FamilyMember, WatchlistItem
+from myome.hereditary.models import FamilyMember, WatchlistItem, relatedness_for
 from myome.hereditary.risk import (
     ComprehensiveRiskAssessment,
+    FamilyCalibratedRisk,
     FamilyOutcome,
     FamilyRiskCalculator,
 )
@@ -22,6 +42,42 @@ from myome.hereditary.watchlist import FamilyHistoryPDFGenerator, WatchlistGener
 
 router = APIRouter(prefix="/hereditary", tags=["Hereditary Health"])
 
+# Stateless helpers shared across requests, so the document processor's
+# extraction patterns are compiled once
+_document_processor = FamilyDocumentProcessor()
+_summary_generator = FamilyHistoryPDFGenerator()
+
+# Age assumed when the user has not set a date of birth
+DEFAULT_USER_AGE = 35
+
+
+def _user_age(user: User) -> int:
+    """Get user age in years from date of birth"""
+    if user.date_of_birth:
+        return datetime.now().year - user.date_of_birth.year
+    return DEFAULT_USER_AGE
+
+
+# Generators and calculators hold only per-age or per-condition configuration
+# and are never mutated after construction, so instances are shared across
+# requests and the worker threads they run in.
+@lru_cache(maxsize=128)
+def _watchlist_generator(user_age: int) -> WatchlistGenerator:
+    """Get shared watchlist generator for an age"""
+    return WatchlistGenerator(user_age)
+
+
+@lru_cache(maxsize=128)
+def _risk_assessment(user_age: int) -> ComprehensiveRiskAssessment:
+    """Get shared comprehensive risk assessment for an age"""
+    return ComprehensiveRiskAssessment(user_age)
+
+
+@lru_cache(maxsize=128)
+def _risk_calculator(condition: str) -> FamilyRiskCalculator:
+    """Get shared risk calculator for a condition"""
+    return FamilyRiskCalculator(condition)
+
 
 # ============== Pydantic Schemas ==============
 
@@ -87,39 +143,52 @@ class ConditionInput(BaseModel):
 # ============== Family Member Routes ==============
 
 
-@router.get("/family")
+async def _load_family_members(
+    session: AsyncSession, user_id: str
+) -> list[FamilyMember]:
+    """Load all of a user's family members for read-only use"""
+    # FamilyMember has no relationships to prefetch; fail loudly if one is
+    # added and lazily loaded instead of silently issuing per-row queries
+    result = await session.execute(
+        select(FamilyMember)
+        .options(raiseload("*"))
+        .where(FamilyMember.user_id == user_id)
+    )
+    return list(result.scalars().all())
+
+
+@router.get("/family", response_class=ORJSONResponse)
 async def list_family_members(
     user: CurrentUser,
     session: DbSession,
-) -> list[dict]:
+) -> ORJSONResponse:
     """List all family members"""
-    result = await session.execute(
-        select(FamilyMember).where(FamilyMember.user_id == user.id)
-    )
-    members = result.scalars().all()
+    members = await _load_family_members(session, user.id)
 
-    return [
-        {
-            "id": m.id,
-            "relationship": m.relationship,
-            "name": m.name,
-            "birth_year": m.birth_year,
-            "death_year": m.death_year,
-            "biological_sex": m.biological_sex,
-            "is_living": m.is_living,
-            "conditions": m.conditions,
-            "biomarkers": m.biomarkers,
-            "medications": m.medications,
-            "smoking_status": m.smoking_status,
-            "cause_of_death": m.cause_of_death,
-            "age_at_death": m.age_at_death,
-            "current_age": m.current_age,
-            "relatedness": m.relatedness,
-            "data_source": m.data_source,
-            "created_at": m.created_at.isoformat() if m.created_at else None,
-        }
-        for m in members
-    ]
+    return ORJSONResponse(
+        [
+            {
+                "id": m.id,
+                "relationship": m.relationship,
+                "name": m.name,
+                "birth_year": m.birth_year,
+                "death_year": m.death_year,
+                "biological_sex": m.biological_sex,
+                "is_living": m.is_living,
+                "conditions": m.conditions,
+                "biomarkers": m.biomarkers,
+                "medications": m.medications,
+                "smoking_status": m.smoking_status,
+                "cause_of_death": m.cause_of_death,
+                "age_at_death": m.age_at_death,
+                "current_age": m.current_age,
+                "relatedness": m.relatedness,
+                "data_source": m.data_source,
+                "created_at": m.created_at,
+            }
+            for m in members
+        ]
+    )
 
 
 @router.post("/family")
@@ -130,7 +199,6 @@ async def create_family_member(
 ) -> dict:
     """Create a new family member"""
     fm = FamilyMember(
-        id=str(uuid4()),
         user_id=user.id,
         relationship=member.relationship,
         name=member.name,
@@ -153,9 +221,10 @@ async def create_family_member(
         data_source="manual",
     )
 
+    # The id is generated client-side and the session keeps attributes loaded
+    # after commit, so the response needs no refresh round-trip
     session.add(fm)
     await session.commit()
-    await session.refresh(fm)
 
     return {
         "id": fm.id,
@@ -166,37 +235,54 @@ async def create_family_member(
     }
 
 
+def _year_value(
+    values: dict[str, Any], field: str, column: InstrumentedAttribute[int | None]
+) -> ColumnElement[int | None]:
+    """Get the new value of a year field, falling back to the stored column"""
+    if field in values:
+        return literal(values[field], type_=Integer)
+    return column.expression
+
+
 @router.patch("/family/{member_id}")
 async def update_family_member(
     member_id: str,
-    update: FamilyMemberUpdate,
+    changes: FamilyMemberUpdate,
     user: CurrentUser,
     session: DbSession,
 ) -> dict:
     """Update a family member"""
+    values: dict[str, Any] = changes.model_dump(exclude_unset=True)
+
+    # Recalculate age at death in the same statement when either year changes
+    if "death_year" in values or "birth_year" in values:
+        death_year = _year_value(values, "death_year", FamilyMember.death_year)
+        birth_year = _year_value(values, "birth_year", FamilyMember.birth_year)
+        values["age_at_death"] = case(
+            (
+                and_(death_year.is_not(None), birth_year.is_not(None)),
+                death_year - birth_year,
+            ),
+            else_=FamilyMember.age_at_death,
+        )
+
     result = await session.execute(
-        select(FamilyMember).where(
+        update(FamilyMember)
+        .where(
             FamilyMember.id == member_id,
             FamilyMember.user_id == user.id,
         )
+        .values(**values)
+        .returning(FamilyMember.id)
     )
-    member = result.scalar_one_or_none()
+    updated_id = result.scalar_one_or_none()
 
-    if not member:
+    if updated_id is None:
         raise HTTPException(status_code=404, detail="Family member not found")
 
-    # Update fields
-    update_data = update.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(member, field, value)
-
-    # Recalculate age at death if needed
-    if member.death_year and member.birth_year:
-        member.age_at_death = member.death_year - member.birth_year
-
     await session.commit()
 
-    return {"id": member.id, "updated": True}
+    return {"id": updated_id, "updated": True}
 
 
 @router.delete("/family/{member_id}")
@@ -207,17 +293,17 @@ async def delete_family_member(
 ) -> dict:
     """Delete a family member"""
     result = await session.execute(
-        select(FamilyMember).where(
+        delete(FamilyMember)
+        .where(
             FamilyMember.id == member_id,
             FamilyMember.user_id == user.id,
         )
+        .returning(FamilyMember.id)
     )
-    member = result.scalar_one_or_none()
 
-    if not member:
+    if result.scalar_one_or_none() is None:
         raise HTTPException(status_code=404, detail="Family member not found")
 
-    await session.delete(member)
     await session.commit()
 
     return {"id": member_id, "deleted": True}
@@ -256,59 +342,61 @@ async def upload_family_document(
         raise HTTPException(status_code=404, detail="Family member not found")
 
     # Process document
-    processor = FamilyDocumentProcessor()
-    extraction = await processor.process_document(
+    extraction = await _document_processor.process_document(
         text=document_text,
         document_type=document_type,
         relative_age_at_document=age_at_document,
     )
 
     # Convert to family member data format
-    processor.convert_to_family_member_data(
+    _document_processor.convert_to_family_member_data(
         extraction=extraction,
         relationship=member.relationship,
         age_at_document=age_at_document,
     )
 
-    # Merge with existing member data
+    # Merge with existing member data. The JSON columns track in-place
+    # changes, so entries are added to the loaded values directly.
     if extraction.biomarkers:
-        existing_biomarkers = member.biomarkers or {}
+        if member.biomarkers is None:
+            member.biomarkers = {}
         for b in extraction.biomarkers:
-            existing_biomarkers[b.name] = {
+            member.biomarkers[b.name] = {
                 "value": b.value,
                 "unit": b.unit,
                 "age_at_measurement": age_at_document,
                 "is_abnormal": b.is_abnormal,
             }
-        member.biomarkers = existing_biomarkers
 
     if extraction.conditions:
-        existing_conditions: list[dict[str, object]] = list(member.conditions or [])
+        if member.conditions is None:
+            member.conditions = []
+        existing_names = {ec.get("condition") for ec in member.conditions}
         for c in extraction.conditions:
             # Check if condition already exists
-            existing_names = [ec.get("condition") for ec in existing_conditions]
             if c.name not in existing_names:
-                existing_conditions.append(
+                member.conditions.append(
                     {
                         "condition": c.name,
                         "onset_age": None,
                         "current": c.status == "active",
                     }
                 )
-        member.conditions = cast(dict[str, object] | None, existing_conditions)
+                existing_names.add(c.name)
 
     if extraction.medications:
-        existing_meds: list[dict[str, object]] = list(member.medications or [])
+        if member.medications is None:
+            member.medications = []
+        existing_med_names = {em.get("name") for em in member.medications}
         for m in extraction.medications:
-            existing_names = [em.get("name") for em in existing_meds]
-            if m.name not in existing_names:
-                existing_meds.append(
+            if m.name not in existing_med_names:
+                member.medications.append(
                     {
                         "name": m.name,
                         "dosage": m.dosage,
                     }
                 )
-        member.medications = cast(dict[str, object] | None, existing_meds)
+                existing_med_names.add(m.name)
 
     member.data_source = "document"
     await session.commit()
@@ -333,43 +421,40 @@ async def upload_family_document(
 # ============== Watchlist Routes ==============
 
 
-@router.get("/watchlist")
+@router.get("/watchlist", response_class=ORJSONResponse)
 async def get_watchlist(
     user: CurrentUser,
     session: DbSession,
-) -> list[dict]:
+) -> ORJSONResponse:
     """Get personalized health watchlist based on family history"""
     # Get family members
-    result = await session.execute(
-        select(FamilyMember).where(FamilyMember.user_id == user.id)
-    )
-    members = result.scalars().all()
+    members = await _load_family_members(session, user.id)
 
     if not members:
-        return []
+        return ORJSONResponse([])
 
-    # Calculate user age
-    user_age = 35  # Default, should come from user profile
-    if user.date_of_birth:
-        user_age = datetime.now().year - user.date_of_birth.year
+    user_age = _user_age(user)
 
-    # Generate watchlist
-    generator = WatchlistGenerator(user_age)
-    watchlist = generator.generate_watchlist(list(members))
+    # Generate watchlist off the event loop; members are fully loaded and
+    # only read, so no session access happens in the worker thread
+    generator = _watchlist_generator(user_age)
+    watchlist = await asyncio.to_thread(generator.generate_watchlist, members)
 
-    return [
-        {
-            "biomarker": item.biomarker,
-            "display_name": item.display_name,
-            "unit": item.unit,
-            "alert_threshold": item.alert_threshold,
-            "alert_direction": item.alert_direction,
-            "priority": item.priority,
-            "family_context": item.family_context,
-            "recommendation": item.recommendation,
-        }
-        for item in watchlist
-    ]
+    return ORJSONResponse(
+        [
+            {
+                "biomarker": item.biomarker,
+                "display_name": item.display_name,
+                "unit": item.unit,
+                "alert_threshold": item.alert_threshold,
+                "alert_direction": item.alert_direction,
+                "priority": item.priority,
+                "family_context": item.family_context,
+                "recommendation": item.recommendation,
+            }
+            for item in watchlist
+        ]
+    )
 
 
 @router.post("/watchlist/regenerate")
@@ -379,46 +464,37 @@ async def regenerate_watchlist(
 ) -> dict:
     """Regenerate watchlist and save to database"""
     # Get family members
-    result = await session.execute(
-        select(FamilyMember).where(FamilyMember.user_id == user.id)
-    )
-    members = result.scalars().all()
+    members = await _load_family_members(session, user.id)
 
     if not members:
         return {"items_created": 0}
 
-    # Calculate user age
-    user_age = 35
-    if user.date_of_birth:
-        user_age = datetime.now().year - user.date_of_birth.year
+    user_age = _user_age(user)
 
     # Generate watchlist
-    generator = WatchlistGenerator(user_age)
-    watchlist = generator.generate_watchlist(list(members))
+    generator = _watchlist_generator(user_age)
+    watchlist = await asyncio.to_thread(generator.generate_watchlist, members)
 
-    # Delete existing watchlist items
-    existing = await session.execute(
-        select(WatchlistItem).where(WatchlistItem.user_id == user.id)
-    )
-    for item in existing.scalars().all():
-        await session.delete(item)
-
-    # Create new items
-    for config in watchlist:
-        item = WatchlistItem(
-            id=str(uuid4()),
-            user_id=user.id,
-            biomarker=config.biomarker,
-            display_name=config.display_name,
-            alert_threshold=config.alert_threshold,
-            alert_direction=config.alert_direction,
-            unit=config.unit,
-            family_context=config.family_context,
-            priority=config.priority,
-            recommendation=config.recommendation,
-            contributing_family_member_id=config.contributing_family_member_id,
-        )
-        session.add(item)
+    # Replace existing watchlist items in two statements
+    await session.execute(delete(WatchlistItem).where(WatchlistItem.user_id == user.id))
+
+    rows = [
+        {
+            "user_id": user.id,
+            "biomarker": config.biomarker,
+            "display_name": config.display_name,
+            "alert_threshold": config.alert_threshold,
+            "alert_direction": config.alert_direction,
+            "unit": config.unit,
+            "family_context": config.family_context,
+            "priority": config.priority,
+            "recommendation": config.recommendation,
+            "contributing_family_member_id": config.contributing_family_member_id,
+        }
+        for config in watchlist
+    ]
+    if rows:
+        await session.execute(insert(WatchlistItem), rows)
 
     await session.commit()
 
@@ -428,73 +504,104 @@ async def regenerate_watchlist(
 # ============== Risk Assessment Routes ==============
 
 
-@router.get("/risk")
+def _rounded_risk(risk: FamilyCalibratedRisk) -> dict:
+    """Format a calibrated risk as display percentages, rounded once"""
+    low, high = risk.confidence_interval
+    return {
+        "population_risk": round(risk.population_risk * 100, 1),
+        "family_calibrated_risk": round(risk.family_calibrated_risk * 100, 1),
+        "risk_increase_factor": round(risk.risk_increase_factor, 2),
+        "confidence_interval": [round(low * 100, 1), round(high * 100, 1)],
+        "contributing_factors": risk.contributing_factors,
+        "recommendation": risk.recommendation,
+    }
+
+
+def _assess_risks(
+    assessment: ComprehensiveRiskAssessment,
+    outcomes: list[FamilyOutcome],
+) -> tuple[dict[str, dict], list[dict]]:
+    """Run a comprehensive assessment and build the risk report sections"""
+    risks = assessment.assess_all_risks(outcomes)
+    rounded = {condition: _rounded_risk(risk) for condition, risk in risks.items()}
+
+    # Priority entries reuse the already rounded factors
+    priority_conditions = [
+        {
+            "condition": risk.condition,
+            "risk_increase_factor": rounded[risk.condition]["risk_increase_factor"],
+            "recommendation": risk.recommendation,
+        }
+        for risk in assessment.get_priority_conditions(risks)
+    ]
+    return rounded, priority_conditions
+
+
+@router.get("/risk", response_class=ORJSONResponse)
 async def get_comprehensive_risk(
     user: CurrentUser,
     session: DbSession,
-) -> dict:
+) -> ORJSONResponse:
     """Get comprehensive family-calibrated risk assessment"""
-    # Get family members
+    # Unnest conditions in the database so only the fields risk assessment
+    # needs are shipped; the outer join keeps members without conditions in
+    # the analyzed count. Members saved without conditions hold JSON null,
+    # which jsonb_array_elements rejects, so non-arrays unnest as empty
+    conditions = case(
+        (
+            func.jsonb_typeof(FamilyMember.conditions) == "array",
+            FamilyMember.conditions,
+        ),
+        else_=literal([], JSONB),
+    )
+    condition = (
+        func.jsonb_array_elements(conditions)
+        .table_valued(column("value", JSONB))
+        .lateral("family_condition")
+    )
     result = await session.execute(
-        select(FamilyMember).where(FamilyMember.user_id == user.id)
+        select(
+            FamilyMember.id,
+            FamilyMember.relationship,
+            condition.c.value.is_not(None),
+            func.coalesce(condition.c.value["condition"].astext, ""),
+            condition.c.value["onset_age"],
+        )
+        .select_from(FamilyMember)
+        .outerjoin(condition, true())
+        .where(FamilyMember.user_id == user.id)
     )
-    members = result.scalars().all()
-
-    # Convert to FamilyOutcome objects
-    outcomes = []
-    for member in members:
-        if not member.conditions:
-            continue
-
-        for cond in member.conditions:
-            outcomes.append(
-                FamilyOutcome(
-                    condition=cond.get("condition", ""),
-                    onset_age=cond.get("onset_age"),
-                    relatedness=member.relatedness,
-                    relationship=member.relationship,
-                )
-            )
+    rows = result.all()
 
-    # Calculate user age
-    user_age = 35
-    if user.date_of_birth:
-        user_age = datetime.now().year - user.date_of_birth.year
+    outcomes = [
+        FamilyOutcome(
+            condition=name,
+            onset_age=onset_age,
+            relatedness=relatedness_for(relationship),
+            relationship=relationship,
+        )
+        for _, relationship, has_condition, name, onset_age in rows
+        if has_condition
+    ]
+    members_analyzed = len({member_id for member_id, *_ in rows})
 
-    # Run comprehensive assessment
-    assessment = ComprehensiveRiskAssessment(user_age)
-    risks = assessment.assess_all_risks(outcomes)
+    user_age = _user_age(user)
 
-    # Get priority conditions
-    priority_conditions = assessment.get_priority_conditions(risks)
+    # Assess and shape the report off the event loop
+    assessment = _risk_assessment(user_age)
+    risks, priority_conditions = await asyncio.to_thread(
+        _assess_risks, assessment, outcomes
+    )
 
-    return {
-        "user_age": user_age,
-        "family_members_analyzed": len(members),
-        "conditions_analyzed": len(risks),
-        "risks": {
-            condition: {
-                "population_risk": round(risk.population_risk * 100, 1),
-                "family_calibrated_risk": round(risk.family_calibrated_risk * 100, 1),
-                "risk_increase_factor": round(risk.risk_increase_factor, 2),
-                "confidence_interval": [
-                    round(risk.confidence_interval[0] * 100, 1),
-                    round(risk.confidence_interval[1] * 100, 1),
-                ],
-                "contributing_factors": risk.contributing_factors,
-                "recommendation": risk.recommendation,
-            }
-            for condition, risk in risks.items()
-        },
-        "priority_conditions": [
-            {
-                "condition": risk.condition,
-                "risk_increase_factor": round(risk.risk_increase_factor, 2),
-                "recommendation": risk.recommendation,
-            }
-            for risk in priority_conditions
-        ],
-    }
+    return ORJSONResponse(
+        {
+            "user_age": user_age,
+            "family_members_analyzed": members_analyzed,
+            "conditions_analyzed": len(risks),
+            "risks": risks,
+            "priority_conditions": priority_conditions,
+        }
+    )
 
 
 @router.post("/risk/calculate")
@@ -514,13 +621,10 @@ async def calculate_single_risk(
         for o in input.family_outcomes
     ]
 
-    # Calculate user age
-    user_age = 35
-    if user.date_of_birth:
-        user_age = datetime.now().year - user.date_of_birth.year
+    user_age = _user_age(user)
 
-    calculator = FamilyRiskCalculator(input.condition)
-    result = calculator.calculate_risk(outcomes, user_age)
+    calculator = _risk_calculator(input.condition)
+    result = await asyncio.to_thread(calculator.calculate_risk, outcomes, user_age)
 
     return {
         "condition": input.condition,
@@ -539,6 +643,20 @@ async def calculate_single_risk(
 # ============== Family History Document Routes ==============
 
 
+def _summarize_family_history(
+    generator: WatchlistGenerator,
+    user_profile: dict,
+    members: list[FamilyMember],
+) -> dict:
+    """Generate the watchlist and the family history summary built from it"""
+    watchlist = generator.generate_watchlist(members)
+    return _summary_generator.generate_summary(
+        user_profile=user_profile,
+        family_members=members,
+        watchlist=watchlist,
+    )
+
+
 @router.get("/history/summary")
 async def get_family_history_summary(
     user: CurrentUser,
@@ -546,30 +664,23 @@ async def get_family_history_summary(
 ) -> dict:
     """Get family health history summary document"""
     # Get family members
-    result = await session.execute(
-        select(FamilyMember).where(FamilyMember.user_id == user.id)
-    )
-    members = list(result.scalars().all())
+    members = await _load_family_members(session, user.id)
 
-    # Calculate user age
-    user_age = 35
-    if user.date_of_birth:
-        user_age = datetime.now().year - user.date_of_birth.year
+    user_age = _user_age(user)
 
-    # Generate watchlist
-    generator = WatchlistGenerator(user_age)
-    watchlist = generator.generate_watchlist(members)
+    user_profile = {
+        "name": f"{user.first_name or ''} {user.last_name or ''}".strip(),
+        "age": user_age,
+        "biological_sex": user.biological_sex,
+    }
 
-    # Generate summary
-    pdf_gen = FamilyHistoryPDFGenerator()
-    summary = pdf_gen.generate_summary(
-        user_profile={
-            "name": f"{user.first_name or ''} {user.last_name or ''}".strip(),
-            "age": user_age,
-            "biological_sex": user.biological_sex,
-        },
-        family_members=members,
-        watchlist=watchlist,
+    # The summary depends on the watchlist, so both stages run back to back
+    # in one worker thread rather than returning to the event loop between
+    summary = await asyncio.to_thread(
+        _summarize_family_history,
+        _watchlist_generator(user_age),
+        user_profile,
+        members,
     )
 
     return summary
@@ -586,10 +697,7 @@ async def generate_artifact(
 ) -> dict:
     """Generate a new hereditary health artifact"""
     # Get family members to include
-    result = await session.execute(
-        select(FamilyMember).where(FamilyMember.user_id == user.id)
-    )
-    members = list(result.scalars().all())
+    members = await _load_family_members(session, user.id)
 
     privacy = PrivacySettings(
         exclude_categories=request.privacy_settings.exclude_categories,
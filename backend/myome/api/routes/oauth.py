@@ -1,21 +1,28 @@
 """OAuth callback routes for device integrations"""
 
 from typing import Literal, cast
-from uuid import uuid4
 
+import orjson
 from fastapi import APIRouter, HTTPException, Query, status
 from fastapi.responses import RedirectResponse
+from sqlalchemy import func, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from myome.api.deps.auth import CurrentUser
 from myome.api.deps.db import DbSession
+from myome.core.cache import get_redis
 from myome.core.config import settings
+from myome.core.http import get_http_client
+from myome.core.logging import logger
 from myome.core.models import Device
+from myome.core.models.device import OAUTH_VENDOR_CLAUSE
 from myome.integrations.oauth import OAuthTokens, WhoopOAuth, WithingsOAuth
 
 router = APIRouter(prefix="/oauth", tags=["OAuth"])
 
-# In-memory state storage (use Redis in production)
-_oauth_states: dict[str, dict] = {}
+# OAuth state is kept in Redis so any worker can complete the callback
+OAUTH_STATE_PREFIX = "myome:oauth:state"
+OAUTH_STATE_TTL_SECONDS = 600
 
 ProviderType = Literal["whoop", "withings"]
 
@@ -32,6 +39,7 @@ def get_oauth_provider(provider: ProviderType) -> WhoopOAuth | WithingsOAuth:
             client_id=settings.whoop_client_id,
             client_secret=settings.whoop_client_secret,
             redirect_uri=settings.whoop_redirect_uri,
+            http_client=get_http_client(),
         )
     elif provider == "withings":
         if not settings.withings_client_id:
@@ -43,6 +51,7 @@ def get_oauth_provider(provider: ProviderType) -> WhoopOAuth | WithingsOAuth:
             client_id=settings.withings_client_id,
             client_secret=settings.withings_client_secret,
             redirect_uri=settings.withings_redirect_uri,
+            http_client=get_http_client(),
         )
     else:
         raise HTTPException(
@@ -51,6 +60,21 @@ def get_oauth_provider(provider: ProviderType) -> WhoopOAuth | WithingsOAuth:
         )
 
 
+def _state_key(state: str) -> str:
+    """Redis key for an OAuth state value"""
+    return f"{OAUTH_STATE_PREFIX}:{state}"
+
+
+async def _pop_oauth_state(state: str) -> dict | None:
+    """Fetch and delete stored OAuth state, so it can only be used once"""
+    try:
+        raw = await get_redis().getdel(_state_key(state))
+    except Exception as e:
+        logger.error(f"Failed to read OAuth state: {e}")
+        return None
+    return orjson.loads(raw) if raw else None
+
+
 def get_device_type_for_provider(provider: ProviderType) -> str:
     """Map provider to device type"""
     mapping = {
@@ -78,10 +102,19 @@ async def initiate_oauth(
     state = oauth.generate_state()
 
     # Store state with user info for callback verification
-    _oauth_states[state] = {
-        "user_id": user.id,
-        "provider": provider,
-    }
+    payload = orjson.dumps({"user_id": user.id, "provider": provider})
+    try:
+        stored = await get_redis().set(
+            _state_key(state), payload, ex=OAUTH_STATE_TTL_SECONDS, nx=True
+        )
+    except Exception as e:
+        logger.error(f"Failed to store OAuth state: {e}")
+        stored = False
+    if not stored:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Unable to start OAuth flow, please retry",
+        )
 
     auth_url = oauth.get_authorization_url(state)
 
@@ -111,7 +144,7 @@ async def oauth_callback(
         )
 
     # Verify state
-    state_data = _oauth_states.pop(state, None)
+    state_data = await _pop_oauth_state(state)
     if not state_data:
         return RedirectResponse(
             url=f"{settings.frontend_url}/devices?error=invalid_state"
@@ -132,12 +165,10 @@ async def oauth_callback(
         return RedirectResponse(
             url=f"{settings.frontend_url}/devices?error=token_exchange_failed&description={str(e)}"
         )
-    finally:
-        await oauth.close()
 
-    # Create or update device record
-    device = Device(
-        id=str(uuid4()),
+    # Create the device, or refresh credentials on the existing one when the
+    # user reconnects, in a single atomic statement
+    stmt = pg_insert(Device).values(
         user_id=user_id,
         name=f"{provider.title()} Device",
         device_type=get_device_type_for_provider(provider),
@@ -145,13 +176,21 @@ async def oauth_callback(
         is_connected=True,
         api_credentials=tokens.to_dict(),
     )
-
-    session.add(device)
+    upsert = stmt.on_conflict_do_update(
+        index_elements=[Device.user_id, Device.vendor],
+        index_where=text(OAUTH_VENDOR_CLAUSE),
+        set_={
+            "api_credentials": stmt.excluded.api_credentials,
+            "is_connected": True,
+            "updated_at": func.now(),
+        },
+    ).returning(Device.id)
+    device_id = (await session.execute(upsert)).scalar_one()
     await session.commit()
 
     # Redirect back to frontend with success
     return RedirectResponse(
-        url=f"{settings.frontend_url}/devices?connected={provider}&device_id={device.id}"
+        url=f"{settings.frontend_url}/devices?connected={provider}&device_id={device_id}"
     )
 
 
@@ -186,10 +225,7 @@ async def refresh_device_tokens(
 
     # Refresh tokens
     oauth = get_oauth_provider(cast(ProviderType, device.vendor))
-    try:
-        new_tokens = await oauth.refresh_tokens(tokens.refresh_token)
-    finally:
-        await oauth.close()
+    new_tokens = await oauth.refresh_tokens(tokens.refresh_token)
 
     # Update device
     device.api_credentials = new_tokens.to_dict()
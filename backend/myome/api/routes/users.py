@@ -2,10 +2,12 @@
 
 from fastapi import APIRouter
 from pydantic import BaseModel
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
-from myome.api.deps.auth import CurrentUser
+from myome.api.deps.auth import CurrentUser, CurrentUserWithProfile
 from myome.api.deps.db import DbSession
-from myome.core.models import HealthProfile
+from myome.core.models import HealthProfile, User
 
 router = APIRouter(prefix="/users", tags=["Users"])
 
@@ -29,6 +31,19 @@ class UserUpdate(BaseModel):
     last_name: str | None = None
 
 
+class HealthProfileRead(BaseModel):
+    """Health profile response"""
+
+    height_cm: float | None = None
+    baseline_weight_kg: float | None = None
+    ethnicity: list[str] | None = None
+    smoking_status: str | None = None
+    alcohol_frequency: str | None = None
+    exercise_frequency: str | None = None
+    diet_type: str | None = None
+    typical_sleep_hours: float | None = None
+
+
 class HealthProfileUpdate(BaseModel):
     """Health profile update request"""
 
@@ -42,10 +57,22 @@ class HealthProfileUpdate(BaseModel):
     typical_sleep_hours: float | None = None
 
 
+def _user_read(user: User) -> UserRead:
+    """Build the user response from a loaded user"""
+    # Row comes from the database and is trusted; skip re-validation
+    return UserRead.model_construct(
+        id=user.id,
+        email=user.email,
+        first_name=user.first_name,
+        last_name=user.last_name,
+        is_active=user.is_active,
+    )
+
+
 @router.get("/me", response_model=UserRead)
 async def get_current_user(user: CurrentUser) -> UserRead:
     """Get current user profile"""
-    return UserRead.model_validate(user)
+    return _user_read(user)
 
 
 @router.patch("/me", response_model=UserRead)
@@ -55,35 +82,42 @@ async def update_current_user(
     session: DbSession,
 ) -> UserRead:
     """Update current user profile"""
-    update_data = update.model_dump(exclude_unset=True)
-
-    for field, value in update_data.items():
-        setattr(user, field, value)
+    # Copy only the fields the client sent, without dumping the whole model
+    for field in update.model_fields_set:
+        setattr(user, field, getattr(update, field))
 
+    # Attributes stay loaded after commit; UserRead reads no server-side values
     await session.commit()
-    await session.refresh(user)
 
-    return UserRead.model_validate(user)
+    return _user_read(user)
 
 
-@router.get("/me/health-profile")
+@router.get(
+    "/me/health-profile",
+    response_model=HealthProfileRead,
+    response_model_exclude_unset=True,
+)
 async def get_health_profile(
-    user: CurrentUser,
+    user: CurrentUserWithProfile,
     session: DbSession,
-) -> dict:
+) -> HealthProfileRead:
     """Get user's health profile"""
-    if user.health_profile:
-        return {
-            "height_cm": user.health_profile.height_cm,
-            "baseline_weight_kg": user.health_profile.baseline_weight_kg,
-            "ethnicity": user.health_profile.ethnicity,
-            "smoking_status": user.health_profile.smoking_status,
-            "alcohol_frequency": user.health_profile.alcohol_frequency,
-            "exercise_frequency": user.health_profile.exercise_frequency,
-            "diet_type": user.health_profile.diet_type,
-            "typical_sleep_hours": user.health_profile.typical_sleep_hours,
-        }
-    return {}
+    profile = user.health_profile
+    if not profile:
+        # No fields set, so the response is an empty object
+        return HealthProfileRead()
+
+    # Row comes from the database and is trusted; skip re-validation
+    return HealthProfileRead.model_construct(
+        height_cm=profile.height_cm,
+        baseline_weight_kg=profile.baseline_weight_kg,
+        ethnicity=profile.ethnicity,
+        smoking_status=profile.smoking_status,
+        alcohol_frequency=profile.alcohol_frequency,
+        exercise_frequency=profile.exercise_frequency,
+        diet_type=profile.diet_type,
+        typical_sleep_hours=profile.typical_sleep_hours,
+    )
 
 
 @router.put("/me/health-profile")
@@ -93,19 +127,20 @@ async def update_health_profile(
     session: DbSession,
 ) -> dict:
     """Create or update user's health profile"""
-    if user.health_profile:
-        # Update existing
-        update_data = profile_data.model_dump(exclude_unset=True)
-        for field, value in update_data.items():
-            setattr(user.health_profile, field, value)
-    else:
-        # Create new
-        profile = HealthProfile(
-            user_id=user.id,
-            **profile_data.model_dump(exclude_unset=True),
+    values = profile_data.model_dump(exclude_unset=True)
+
+    # Insert or update on the unique user_id in one statement, so the
+    # existing profile never has to be loaded first
+    stmt = pg_insert(HealthProfile).values(user_id=user.id, **values)
+    await session.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[HealthProfile.user_id],
+            set_={
+                **{field: stmt.excluded[field] for field in values},
+                "updated_at": func.now(),
+            },
         )
-        session.add(profile)
-
+    )
     await session.commit()
 
     return {"status": "updated"}
@@ -0,0 +1,9 @@
+"""Shared base for API schemas"""
+
+from pydantic import BaseModel, ConfigDict
+
+
+class SchemaBase(BaseModel):
+    """Base schema; validators are built on first use rather than at import"""
+
+    model_config = ConfigDict(defer_build=True)
@@ -2,10 +2,12 @@
 
 from datetime import datetime
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import ConfigDict, Field
 
+from myome.api.schemas.base import SchemaBase
 
-class HeartRateBase(BaseModel):
+
+class HeartRateBase(SchemaBase):
     """Base heart rate schema"""
 
     heart_rate_bpm: int = Field(..., ge=20, le=300)
@@ -30,7 +32,7 @@ class HeartRateRead(HeartRateBase):
     device_id: str | None = None
 
 
-class GlucoseBase(BaseModel):
+class GlucoseBase(SchemaBase):
     """Base glucose schema"""
 
     glucose_mg_dl: float = Field(..., ge=20, le=600)
@@ -55,7 +57,7 @@ class GlucoseRead(GlucoseBase):
     is_calibrated: bool
 
 
-class HRVBase(BaseModel):
+class HRVBase(SchemaBase):
     """Base HRV schema"""
 
     sdnn_ms: float | None = Field(None, ge=0)
@@ -83,7 +85,7 @@ class HRVRead(HRVBase):
     user_id: str
 
 
-class SleepSessionBase(BaseModel):
+class SleepSessionBase(SchemaBase):
     """Base sleep session schema"""
 
     start_time: datetime
@@ -123,7 +125,7 @@ class SleepSessionRead(SleepSessionBase):
     device_id: str | None = None
 
 
-class ActivityBase(BaseModel):
+class ActivityBase(SchemaBase):
     """Base activity schema"""
 
     steps: int | None = Field(None, ge=0)
@@ -150,7 +152,7 @@ class ActivityRead(ActivityBase):
     user_id: str
 
 
-class BodyCompositionBase(BaseModel):
+class BodyCompositionBase(SchemaBase):
     """Base body composition schema"""
 
     weight_kg: float = Field(..., ge=20, le=500)
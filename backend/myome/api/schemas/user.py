@@ -2,10 +2,12 @@
 
 from datetime import date, datetime
 
-from pydantic import BaseModel, ConfigDict, EmailStr, Field
+from pydantic import ConfigDict, EmailStr, Field
 
+from myome.api.schemas.base import SchemaBase
 
-class UserBase(BaseModel):
+
+class UserBase(SchemaBase):
     """Base user schema"""
 
     email: EmailStr
@@ -33,7 +35,7 @@ class UserRead(UserBase):
     created_at: datetime
 
 
-class UserUpdate(BaseModel):
+class UserUpdate(SchemaBase):
     """Schema for updating a user"""
 
     first_name: str | None = None
@@ -1,7 +1,136 @@
 """FHIR resource generation"""
 
+import os
+from collections.abc import Iterable, Iterator
 from datetime import UTC, datetime
-from uuid import uuid4
+from functools import lru_cache
+from uuid import UUID
+
+OBSERVATION_CATEGORY_SYSTEM = (
+    "http://terminology.hl7.org/CodeSystem/observation-category"
+)
+LOINC_SYSTEM = "http://loinc.org"
+UCUM_SYSTEM = "http://unitsofmeasure.org"
+
+# Resource ids drawn per urandom call
+ID_BATCH_SIZE = 64
+
+_GENDER_MAP = {
+    "male": "male",
+    "female": "female",
+    "other": "other",
+}
+
+# Static resource fragments below are shared by reference between generated
+# resources and must not be mutated
+
+_BLOOD_PRESSURE_CODE = {
+    "coding": [
+        {
+            "system": LOINC_SYSTEM,
+            "code": "85354-9",
+            "display": "Blood pressure panel with all children optional",
+        }
+    ]
+}
+_SYSTOLIC_CODE = {
+    "coding": [
+        {
+            "system": LOINC_SYSTEM,
+            "code": "8480-6",
+            "display": "Systolic blood pressure",
+        }
+    ]
+}
+_DIASTOLIC_CODE = {
+    "coding": [
+        {
+            "system": LOINC_SYSTEM,
+            "code": "8462-4",
+            "display": "Diastolic blood pressure",
+        }
+    ]
+}
+
+_REPORT_CATEGORY = [
+    {
+        "coding": [
+            {
+                "system": "http://terminology.hl7.org/CodeSystem/v2-0074",
+                "code": "OTH",
+                "display": "Other",
+            }
+        ],
+        "text": "Personal Health Monitoring Summary",
+    }
+]
+_REPORT_CODE = {
+    "coding": [
+        {
+            "system": LOINC_SYSTEM,
+            "code": "77599-9",
+            "display": "Additional documentation",
+        }
+    ],
+    "text": "Myome Continuous Health Monitoring Report",
+}
+_REPORT_PERFORMER = [
+    {
+        "reference": "Device/myome-system",
+        "display": "Myome Health Monitoring System",
+    }
+]
+
+
+def _resource_ids() -> Iterator[str]:
+    """Yield random (version 4) resource ids, reading entropy in batches"""
+    while True:
+        buf = os.urandom(16 * ID_BATCH_SIZE)
+        for offset in range(0, len(buf), 16):
+            yield str(UUID(bytes=buf[offset : offset + 16], version=4))
+
+
+def _fhir_datetime(timestamp: datetime) -> str:
+    """Format a timestamp as a FHIR dateTime, reading naive values as UTC"""
+    text = timestamp.isoformat()
+    return text if timestamp.tzinfo else text + "Z"
+
+
+@lru_cache(maxsize=64)
+def _observation_category(category: str) -> list[dict]:
+    """Get the shared category block for an Observation category"""
+    return [
+        {
+            "coding": [
+                {
+                    "system": OBSERVATION_CATEGORY_SYSTEM,
+                    "code": category,
+                    "display": category.replace("-", " ").title(),
+                }
+            ]
+        }
+    ]
+
+
+@lru_cache(maxsize=256)
+def _observation_template(code: str, display: str, unit: str, category: str) -> dict:
+    """Get the static blocks of an Observation, built once per kind"""
+    return {
+        "category": _observation_category(category),
+        "code": {
+            "coding": [
+                {
+                    "system": LOINC_SYSTEM,
+                    "code": code,
+                    "display": display,
+                }
+            ]
+        },
+        "valueQuantity": {
+            "unit": unit,
+            "system": UCUM_SYSTEM,
+        },
+    }
 
 
 class FHIRResourceGenerator:
@@ -9,15 +138,18 @@ class FHIRResourceGenerator:
 
     def __init__(self, user_id: str):
         self.user_id = user_id
+        self._subject = {"reference": f"Patient/{user_id}"}
+        self._ids = _resource_ids()
+        # Generators are created per export, so every resource in one shares
+        # a single lastUpdated instead of reading the clock per resource
+        self._meta = {"lastUpdated": datetime.now(UTC).isoformat()}
 
     def create_patient(self, user_data: dict) -> dict:
         """Create FHIR Patient resource"""
         return {
             "resourceType": "Patient",
             "id": self.user_id,
-            "meta": {
-                "lastUpdated": datetime.now(UTC).isoformat(),
-            },
+            "meta": self._meta,
             "name": [
                 {
                     "use": "official",
@@ -39,46 +171,17 @@ class FHIRResourceGenerator:
         category: str = "vital-signs",
     ) -> dict:
         """Create FHIR Observation resource"""
+        template = _observation_template(code, display, unit, category)
         return {
             "resourceType": "Observation",
-            "id": str(uuid4()),
-            "meta": {
-                "lastUpdated": datetime.now(UTC).isoformat(),
-            },
+            "id": next(self._ids),
+            "meta": self._meta,
             "status": "final",
-            "category": [
-                {
-                    "coding": [
-                        {
-                            "system": "http://terminology.hl7.org/CodeSystem/observation-category",
-                            "code": category,
-                            "display": category.replace("-", " ").title(),
-                        }
-                    ]
-                }
-            ],
-            "code": {
-                "coding": [
-                    {
-                        "system": "http://loinc.org",
-                        "code": code,
-                        "display": display,
-                    }
-                ]
-            },
-            "subject": {
-                "reference": f"Patient/{self.user_id}",
-            },
-            "effectiveDateTime": (
-                timestamp.isoformat()
-                if timestamp.tzinfo
-                else timestamp.isoformat() + "Z"
-            ),
-            "valueQuantity": {
-                "value": value,
-                "unit": unit,
-                "system": "http://unitsofmeasure.org",
-            },
+            "category": template["category"],
+            "code": template["code"],
+            "subject": self._subject,
+            "effectiveDateTime": _fhir_datetime(timestamp),
+            "valueQuantity": {"value": value, **template["valueQuantity"]},
         }
 
     def create_heart_rate_observation(self, hr_bpm: int, timestamp: datetime) -> dict:
@@ -135,71 +238,29 @@ class FHIRResourceGenerator:
         """Create blood pressure FHIR observation with multiple components"""
         return {
             "resourceType": "Observation",
-            "id": str(uuid4()),
-            "meta": {
-                "lastUpdated": datetime.now(UTC).isoformat(),
-            },
+            "id": next(self._ids),
+            "meta": self._meta,
             "status": "final",
-            "category": [
-                {
-                    "coding": [
-                        {
-                            "system": "http://terminology.hl7.org/CodeSystem/observation-category",
-                            "code": "vital-signs",
-                            "display": "Vital Signs",
-                        }
-                    ]
-                }
-            ],
-            "code": {
-                "coding": [
-                    {
-                        "system": "http://loinc.org",
-                        "code": "85354-9",
-                        "display": "Blood pressure panel with all children optional",
-                    }
-                ]
-            },
-            "subject": {
-                "reference": f"Patient/{self.user_id}",
-            },
-            "effectiveDateTime": (
-                timestamp.isoformat()
-                if timestamp.tzinfo
-                else timestamp.isoformat() + "Z"
-            ),
+            "category": _observation_category("vital-signs"),
+            "code": _BLOOD_PRESSURE_CODE,
+            "subject": self._subject,
+            "effectiveDateTime": _fhir_datetime(timestamp),
             "component": [
                 {
-                    "code": {
-                        "coding": [
-                            {
-                                "system": "http://loinc.org",
-                                "code": "8480-6",
-                                "display": "Systolic blood pressure",
-                            }
-                        ]
-                    },
+                    "code": _SYSTOLIC_CODE,
                     "valueQuantity": {
                         "value": systolic,
                         "unit": "mmHg",
-                        "system": "http://unitsofmeasure.org",
+                        "system": UCUM_SYSTEM,
                         "code": "mm[Hg]",
                     },
                 },
                 {
-                    "code": {
-                        "coding": [
-                            {
-                                "system": "http://loinc.org",
-                                "code": "8462-4",
-                                "display": "Diastolic blood pressure",
-                            }
-                        ]
-                    },
+                    "code": _DIASTOLIC_CODE,
                     "valueQuantity": {
                         "value": diastolic,
                         "unit": "mmHg",
-                        "system": "http://unitsofmeasure.org",
+                        "system": UCUM_SYSTEM,
                         "code": "mm[Hg]",
                     },
                 },
@@ -214,47 +275,18 @@ class FHIRResourceGenerator:
         """Create FHIR DiagnosticReport from physician report"""
         return {
             "resourceType": "DiagnosticReport",
-            "id": str(uuid4()),
-            "meta": {
-                "lastUpdated": datetime.now(UTC).isoformat(),
-            },
+            "id": next(self._ids),
+            "meta": self._meta,
             "status": "final",
-            "category": [
-                {
-                    "coding": [
-                        {
-                            "system": "http://terminology.hl7.org/CodeSystem/v2-0074",
-                            "code": "OTH",
-                            "display": "Other",
-                        }
-                    ],
-                    "text": "Personal Health Monitoring Summary",
-                }
-            ],
-            "code": {
-                "coding": [
-                    {
-                        "system": "http://loinc.org",
-                        "code": "77599-9",
-                        "display": "Additional documentation",
-                    }
-                ],
-                "text": "Myome Continuous Health Monitoring Report",
-            },
-            "subject": {
-                "reference": f"Patient/{self.user_id}",
-            },
+            "category": _REPORT_CATEGORY,
+            "code": _REPORT_CODE,
+            "subject": self._subject,
             "effectivePeriod": {
                 "start": report_data["metadata"]["period_start"],
                 "end": report_data["metadata"]["period_end"],
             },
             "issued": report_data["metadata"]["generated_at"],
-            "performer": [
-                {
-                    "reference": "Device/myome-system",
-                    "display": "Myome Health Monitoring System",
-                }
-            ],
+            "performer": _REPORT_PERFORMER,
             "result": [
                 {
                     "reference": f"Observation/{obs['id']}",
@@ -265,27 +297,22 @@ class FHIRResourceGenerator:
             "conclusion": self._generate_conclusion(report_data),
         }
 
-    def create_bundle(self, resources: list[dict]) -> dict:
+    def create_bundle(self, resources: Iterable[dict]) -> dict:
         """Create FHIR Bundle containing multiple resources"""
+        entry = [{"resource": resource} for resource in resources]
         return {
             "resourceType": "Bundle",
-            "id": str(uuid4()),
-            "meta": {
-                "lastUpdated": datetime.now(UTC).isoformat(),
-            },
+            "id": next(self._ids),
+            "meta": self._meta,
             "type": "collection",
-            "total": len(resources),
-            "entry": [{"resource": resource} for resource in resources],
+            "total": len(entry),
+            "entry": entry,
         }
 
-    def _map_gender(self, biological_sex: str | None) -> str:
+    @staticmethod
+    def _map_gender(biological_sex: str | None) -> str:
         """Map biological sex to FHIR gender"""
-        mapping = {
-            "male": "male",
-            "female": "female",
-            "other": "other",
-        }
-        return mapping.get(biological_sex, "unknown") if biological_sex else "unknown"
+        return _GENDER_MAP.get(biological_sex or "", "unknown")
 
     def _generate_conclusion(self, report_data: dict) -> str:
         """Generate report conclusion text"""
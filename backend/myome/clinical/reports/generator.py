@@ -1,13 +1,40 @@
 """Physician report generation"""
 
+import asyncio
+from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
+import numpy as np
+
 from myome.analytics.data_loader import TimeSeriesLoader
 from myome.analytics.service import AnalyticsService
 from myome.core.logging import logger
 
+# Sleep session columns averaged for the report
+_SLEEP_COLUMNS = (
+    "total_sleep_minutes",
+    "deep_sleep_minutes",
+    "rem_sleep_minutes",
+    "sleep_efficiency_pct",
+)
+
+
+def _describe(values: np.ndarray) -> tuple[float, float, float, float]:
+    """Mean, sample std, min and max of the non-NaN values (NaN when missing)"""
+    valid = values[~np.isnan(values)]
+    if valid.size == 0:
+        return np.nan, np.nan, np.nan, np.nan
+    std = float(valid.std(ddof=1)) if valid.size > 1 else np.nan
+    return float(valid.mean()), std, float(valid.min()), float(valid.max())
+
+
+def _slope(x: np.ndarray, y: np.ndarray) -> float:
+    """Least-squares slope of y over x, in closed form"""
+    dx = x - x.mean()
+    return float(dx @ (y - y.mean()) / (dx @ dx))
+
 
 @dataclass
 class ReportSection:
@@ -46,49 +73,50 @@ class PhysicianReportGenerator:
 
         start_date = report_date - timedelta(days=months_lookback * 30)
 
+        # The daily analysis and health score feed several sections; compute
+        # each once, alongside the detailed analysis loads
+        analysis, health_score, detailed_analysis = await asyncio.gather(
+            self.analytics.run_daily_analysis(report_date),
+            self.analytics.get_health_score(report_date),
+            self._generate_detailed_analysis(start_date, report_date),
+        )
+
+        # Partition alerts by priority once for the summary and recommendations
+        alerts_by_priority: dict[str, list[dict]] = defaultdict(list)
+        for alert in analysis.get("alerts", []):
+            alerts_by_priority[alert.get("priority", "normal")].append(alert)
+
+        report_date_iso = report_date.isoformat()
         report = {
             "metadata": {
                 "patient_id": self.user_id,
-                "report_date": report_date.isoformat(),
+                "report_date": report_date_iso,
                 "period_start": start_date.isoformat(),
-                "period_end": report_date.isoformat(),
+                "period_end": report_date_iso,
                 "months_covered": months_lookback,
                 "generated_at": datetime.now(UTC).isoformat(),
             },
-            "executive_summary": await self._generate_executive_summary(
-                start_date, report_date
-            ),
-            "detailed_analysis": await self._generate_detailed_analysis(
-                start_date, report_date
-            ),
-            "risk_assessment": await self._generate_risk_assessment(
-                start_date, report_date
+            "executive_summary": self._generate_executive_summary(
+                analysis, health_score, alerts_by_priority
             ),
-            "recommendations": await self._generate_recommendations(
-                start_date, report_date
+            "detailed_analysis": detailed_analysis,
+            "risk_assessment": self._generate_risk_assessment(health_score),
+            "recommendations": self._generate_recommendations(
+                analysis, alerts_by_priority
             ),
         }
 
         return report
 
-    async def _generate_executive_summary(
+    def _generate_executive_summary(
         self,
-        start: datetime,
-        end: datetime,
+        analysis: dict,
+        health_score: dict,
+        alerts_by_priority: dict[str, list[dict]],
     ) -> dict:
         """Generate Tier 1: Executive Summary (30 second review)"""
-
-        # Get daily analysis
-        analysis = await self.analytics.run_daily_analysis(end)
-        health_score = await self.analytics.get_health_score(end)
-
-        # Categorize alerts by priority
-        critical_alerts = [
-            a for a in analysis.get("alerts", []) if a.get("priority") == "critical"
-        ]
-        high_alerts = [
-            a for a in analysis.get("alerts", []) if a.get("priority") == "high"
-        ]
+        critical_alerts = alerts_by_priority.get("critical", [])
+        high_alerts = alerts_by_priority.get("high", [])
 
         return {
             "overall_status": self._determine_status(health_score, critical_alerts),
@@ -106,17 +134,28 @@ class PhysicianReportGenerator:
     ) -> dict:
         """Generate Tier 2: Detailed Analysis (5 minute review)"""
 
+        # Sections load their own series in separate sessions, so the
+        # queries can overlap
+        cardiovascular, metabolic, sleep_recovery, correlations = await asyncio.gather(
+            self._analyze_cardiovascular(start, end),
+            self._analyze_metabolic(start, end),
+            self._analyze_sleep(start, end),
+            self._get_top_correlations(start, end),
+        )
+
         return {
-            "cardiovascular": await self._analyze_cardiovascular(start, end),
-            "metabolic": await self._analyze_metabolic(start, end),
-            "sleep_recovery": await self._analyze_sleep(start, end),
-            "correlations": await self._get_top_correlations(start, end),
+            "cardiovascular": cardiovascular,
+            "metabolic": metabolic,
+            "sleep_recovery": sleep_recovery,
+            "correlations": correlations,
         }
 
     async def _analyze_cardiovascular(self, start: datetime, end: datetime) -> dict:
         """Detailed cardiovascular analysis"""
-        hr_df = await self.loader.load_heart_rate(start, end, resample="1D")
-        hrv_df = await self.loader.load_hrv(start, end, resample="1D")
+        hr_df, hrv_df = await asyncio.gather(
+            self.loader.load_heart_rate(start, end, resample="1D"),
+            self.loader.load_hrv(start, end, resample="1D"),
+        )
 
         result: dict[str, object] = {
             "resting_heart_rate": None,
@@ -126,27 +165,25 @@ class PhysicianReportGenerator:
         }
 
         if not hr_df.empty:
+            # One pass over the raw array instead of a scan per statistic
+            hr = hr_df["heart_rate_bpm"].to_numpy(dtype=np.float64)
+            hr_mean, _, hr_min, hr_max = _describe(hr)
             result["resting_heart_rate"] = {
-                "current": float(hr_df["heart_rate_bpm"].iloc[-1]),
-                "average": float(hr_df["heart_rate_bpm"].mean()),
-                "min": int(hr_df["heart_rate_bpm"].min()),
-                "max": int(hr_df["heart_rate_bpm"].max()),
+                "current": float(hr[-1]),
+                "average": hr_mean,
+                "min": int(hr_min),
+                "max": int(hr_max),
                 "trend": self._calculate_trend(hr_df["heart_rate_bpm"]),
             }
 
         if not hrv_df.empty and "sdnn_ms" in hrv_df.columns:
-            current_hrv = (
-                hrv_df["sdnn_ms"].iloc[-1]
-                if not hrv_df["sdnn_ms"].isna().iloc[-1]
-                else None
-            )
-            avg_hrv = hrv_df["sdnn_ms"].mean()
+            sdnn = hrv_df["sdnn_ms"].to_numpy(dtype=np.float64)
+            current_hrv = None if np.isnan(sdnn[-1]) else float(sdnn[-1])
+            avg_hrv, _, _, _ = _describe(sdnn)
 
             result["hrv_analysis"] = {
-                "current_sdnn": float(current_hrv) if current_hrv else None,
-                "average_sdnn": (
-                    float(avg_hrv) if not hrv_df["sdnn_ms"].isna().all() else None
-                ),
+                "current_sdnn": current_hrv if current_hrv else None,
+                "average_sdnn": None if np.isnan(avg_hrv) else avg_hrv,
                 "trend": self._calculate_trend(hrv_df["sdnn_ms"].dropna()),
                 "interpretation": self._interpret_hrv(current_hrv, avg_hrv),
             }
@@ -179,21 +216,27 @@ class PhysicianReportGenerator:
         }
 
         if not glucose_df.empty:
-            glucose = glucose_df["glucose_mg_dl"]
-
-            # Calculate time in range (70-180 mg/dL)
-            tir = ((glucose >= 70) & (glucose <= 180)).mean() * 100
-            time_below = (glucose < 70).mean() * 100
-            time_above = (glucose > 180).mean() * 100
+            glucose = glucose_df["glucose_mg_dl"].to_numpy(dtype=np.float64)
+            n = glucose.size
+
+            # Calculate time in range (70-180 mg/dL); in-range is what is
+            # left after the two out-of-range counts and any gaps
+            below = np.count_nonzero(glucose < 70)
+            above = np.count_nonzero(glucose > 180)
+            in_range = n - below - above - np.count_nonzero(np.isnan(glucose))
+            tir = in_range / n * 100
+            time_below = below / n * 100
+            time_above = above / n * 100
 
             # Calculate variability
-            cv = (glucose.std() / glucose.mean()) * 100 if glucose.mean() > 0 else 0
+            mean, std, minimum, maximum = _describe(glucose)
+            cv = (std / mean) * 100 if mean > 0 else 0
 
             result["glucose_metrics"] = {
-                "mean": float(glucose.mean()),
-                "std": float(glucose.std()),
-                "min": float(glucose.min()),
-                "max": float(glucose.max()),
+                "mean": mean,
+                "std": std,
+                "min": minimum,
+                "max": maximum,
                 "coefficient_of_variation": float(cv),
             }
 
@@ -236,56 +279,35 @@ class PhysicianReportGenerator:
         }
 
         if not sleep_df.empty:
-            avg_duration = float(sleep_df["total_sleep_minutes"].mean())
-            avg_deep = sleep_df.get("deep_sleep_minutes", 0)
-            avg_rem = sleep_df.get("rem_sleep_minutes", 0)
-            avg_efficiency = sleep_df.get("sleep_efficiency_pct", 0)
+            # Average every present column in one call; columns that are
+            # missing or hold no data are left out rather than read as 0
+            wanted = [c for c in _SLEEP_COLUMNS if c in sleep_df.columns]
+            means = sleep_df[wanted].astype(np.float64).mean().dropna().to_dict()
+            avg_duration = means.get("total_sleep_minutes", 0.0)
+            avg_deep = means.get("deep_sleep_minutes")
+            avg_rem = means.get("rem_sleep_minutes")
+            avg_efficiency = means.get("sleep_efficiency_pct")
 
             result["average_duration"] = {
-                "minutes": (
-                    float(avg_duration)
-                    if hasattr(avg_duration, "__float__")
-                    else avg_duration
-                ),
-                "hours": (
-                    float(avg_duration / 60)
-                    if hasattr(avg_duration, "__float__")
-                    else avg_duration / 60
-                ),
+                "minutes": avg_duration,
+                "hours": avg_duration / 60,
                 "target": "7-9 hours",
                 "status": "good" if 420 <= avg_duration <= 540 else "needs_improvement",
             }
 
-            if hasattr(avg_deep, "mean"):
-                avg_deep = avg_deep.mean()
-            if hasattr(avg_rem, "mean"):
-                avg_rem = avg_rem.mean()
-            if hasattr(avg_efficiency, "mean"):
-                avg_efficiency = avg_efficiency.mean()
-
-            avg_deep_value = float(avg_deep) if hasattr(avg_deep, "__float__") else 0.0
-            avg_rem_value = float(avg_rem) if hasattr(avg_rem, "__float__") else 0.0
-            avg_efficiency_value = (
-                float(avg_efficiency) if hasattr(avg_efficiency, "__float__") else 0.0
-            )
-
             result["sleep_architecture"] = {
-                "deep_sleep_minutes": avg_deep_value if avg_deep else None,
-                "rem_sleep_minutes": avg_rem_value if avg_rem else None,
+                "deep_sleep_minutes": avg_deep or None,
+                "rem_sleep_minutes": avg_rem or None,
                 "deep_pct": (
-                    float((avg_deep_value / avg_duration) * 100)
-                    if avg_deep and avg_duration
-                    else None
+                    avg_deep / avg_duration * 100 if avg_deep and avg_duration else None
                 ),
                 "rem_pct": (
-                    float((avg_rem_value / avg_duration) * 100)
-                    if avg_rem and avg_duration
-                    else None
+                    avg_rem / avg_duration * 100 if avg_rem and avg_duration else None
                 ),
             }
 
             result["efficiency"] = {
-                "average_pct": avg_efficiency_value if avg_efficiency else None,
+                "average_pct": avg_efficiency or None,
                 "target": ">85%",
                 "status": (
                     "good"
@@ -296,29 +318,28 @@ class PhysicianReportGenerator:
 
         return result
 
-    async def _generate_risk_assessment(self, start: datetime, end: datetime) -> dict:
+    def _generate_risk_assessment(self, health_score: dict) -> dict:
         """Generate risk assessment scores"""
-        health_score = await self.analytics.get_health_score(end)
-
         return {
             "overall_health_score": health_score.get("score"),
             "component_scores": health_score.get("components", {}),
             "risk_factors": [],  # Would integrate with genetic/biomarker data
         }
 
-    async def _generate_recommendations(
-        self, start: datetime, end: datetime
+    def _generate_recommendations(
+        self,
+        analysis: dict,
+        alerts_by_priority: dict[str, list[dict]],
     ) -> list[dict]:
         """Generate clinical recommendations"""
-        analysis = await self.analytics.run_daily_analysis(end)
         recommendations = []
 
-        # Based on alerts
-        for alert in analysis.get("alerts", []):
-            if alert.get("priority") in ["critical", "high"]:
+        # Based on alerts, most urgent first
+        for priority in ("critical", "high"):
+            for alert in alerts_by_priority.get(priority, []):
                 recommendations.append(
                     {
-                        "priority": alert.get("priority"),
+                        "priority": priority,
                         "category": alert.get("biomarker"),
                         "recommendation": f"Address {alert.get('title', 'alert')}",
                         "rationale": alert.get("message"),
@@ -385,16 +406,14 @@ class PhysicianReportGenerator:
             return "insufficient_data"
 
         # Simple linear regression
-        import numpy as np
-
-        x = np.arange(len(series))
-        y = series.values
+        x = np.arange(len(series), dtype=np.float64)
+        y = np.asarray(series, dtype=np.float64)
         valid = ~np.isnan(y)
 
-        if valid.sum() < 7:
+        if np.count_nonzero(valid) < 7:
             return "insufficient_data"
 
-        slope = np.polyfit(x[valid], y[valid], 1)[0]
+        slope = _slope(x[valid], y[valid])
 
         if abs(slope) < 0.1:
             return "stable"
@@ -0,0 +1,99 @@
+"""Redis-backed response cache for expensive read endpoints"""
+
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeVar, cast
+
+import orjson
+from redis.asyncio import Redis
+
+from myome.core.config import settings
+from myome.core.logging import logger
+
+T = TypeVar("T")
+
+CACHE_PREFIX = "myome:cache"
+
+# Per-user key index outlives the longest entry TTL used by callers
+INDEX_TTL_SECONDS = 3600
+
+_ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+_redis: Redis | None = None
+
+
+def get_redis() -> Redis:
+    """Get shared async Redis client"""
+    global _redis
+    if _redis is None:
+        _redis = Redis.from_url(
+            str(settings.redis_url),
+            socket_connect_timeout=1.0,
+            socket_timeout=1.0,
+        )
+    return _redis
+
+
+def cache_key(user_id: str, namespace: str, *params: object) -> str:
+    """Build a user-scoped cache key"""
+    suffix = ":".join(str(p) for p in params)
+    return f"{CACHE_PREFIX}:{user_id}:{namespace}:{suffix}"
+
+
+def _user_index_key(user_id: str) -> str:
+    """Key of the set tracking all cached entries for a user"""
+    return f"{CACHE_PREFIX}:{user_id}:__keys__"
+
+
+async def get_or_compute(
+    user_id: str,
+    key: str,
+    ttl_seconds: int,
+    compute: Callable[[], Awaitable[T]],
+) -> T:
+    """
+    Return cached value for key, computing and caching it on a miss.
+
+    Cache errors never fail the request; the value is computed directly.
+    """
+    if not settings.cache_enabled:
+        return await compute()
+
+    client = get_redis()
+
+    try:
+        cached = await client.get(key)
+        if cached is not None:
+            return orjson.loads(cached)
+    except Exception as e:
+        logger.warning(f"Cache read failed for {key}: {e}")
+        return await compute()
+
+    value = await compute()
+
+    try:
+        payload = orjson.dumps(value, option=_ORJSON_OPTIONS)
+        index_key = _user_index_key(user_id)
+        async with client.pipeline(transaction=False) as pipe:
+            pipe.set(key, payload, ex=ttl_seconds)
+            pipe.sadd(index_key, key)
+            pipe.expire(index_key, INDEX_TTL_SECONDS)
+            await pipe.execute()
+    except Exception as e:
+        logger.warning(f"Cache write failed for {key}: {e}")
+
+    return value
+
+
+async def invalidate_user(user_id: str) -> None:
+    """Drop all cached entries for a user (called after data writes)"""
+    if not settings.cache_enabled:
+        return
+
+    client = get_redis()
+    index_key = _user_index_key(user_id)
+
+    try:
+        keys = await cast(Awaitable[set[Any]], client.smembers(index_key))
+        await client.delete(index_key, *keys)
+    except Exception as e:
+        logger.warning(f"Cache invalidation failed for user {user_id}: {e}")
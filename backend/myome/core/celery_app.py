@@ -5,30 +5,21 @@ from celery.schedules import crontab
 
 from myome.core.config import settings
 
+# Redis serves as both the broker and the result backend
+REDIS_URL = str(settings.redis_url)
+
 celery_app = Celery(
     "myome",
-    broker=str(settings.redis_url),
-    backend=str(settings.redis_url),
+    broker=REDIS_URL,
+    backend=REDIS_URL,
     include=[
         "myome.sensors.tasks",
         "myome.integrations.tasks",
     ],
 )
 
-# Celery configuration
-celery_app.conf.update(
-    task_serializer="json",
-    accept_content=["json"],
-    result_serializer="json",
-    timezone="UTC",
-    enable_utc=True,
-    task_track_started=True,
-    task_time_limit=600,  # 10 minutes max per task
-    worker_prefetch_multiplier=1,
-)
-
 # Beat schedule for periodic tasks
-celery_app.conf.beat_schedule = {
+BEAT_SCHEDULE = {
     # Sync all connected devices every 15 minutes
     "sync-all-devices": {
         "task": "myome.integrations.tasks.sync_all_devices",
@@ -40,3 +31,28 @@ celery_app.conf.beat_schedule = {
         "schedule": crontab(hour=3, minute=0),
     },
 }
+
+# Celery configuration
+celery_app.conf.update(
+    task_serializer="json",
+    accept_content=["json"],
+    result_serializer="json",
+    timezone="UTC",
+    enable_utc=True,
+    task_track_started=True,
+    task_time_limit=600,  # 10 minutes max per task
+    worker_prefetch_multiplier=1,
+    # Ack after the task finishes so a lost worker's task is redelivered;
+    # the visibility timeout must outlast task_time_limit
+    task_acks_late=True,
+    broker_transport_options={
+        "visibility_timeout": 3600,
+        "socket_keepalive": True,
+        "health_check_interval": 30,
+    },
+    result_backend_transport_options={"retry_on_timeout": True},
+    broker_pool_limit=None,
+    broker_connection_retry_on_startup=True,
+    result_expires=3600,
+    beat_schedule=BEAT_SCHEDULE,
+)
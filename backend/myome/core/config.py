@@ -33,9 +33,13 @@ class Settings(BaseSettings):
     )
     database_pool_size: int = 10
     database_max_overflow: int = 20
+    database_query_cache_size: int = 1200
+    database_pool_recycle: int = 1800  # seconds
+    database_pool_pre_ping: bool = True
 
     # Redis (for caching and Celery)
     redis_url: str = Field(default="redis://localhost:6379/0")
+    cache_enabled: bool = True
 
     # Security
     secret_key: str = Field(default="CHANGE-THIS-IN-PRODUCTION-USE-OPENSSL-RAND-HEX-32")
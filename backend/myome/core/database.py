@@ -2,7 +2,9 @@
 
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from typing import Any
 
+import orjson
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
@@ -19,18 +21,31 @@ class Base(DeclarativeBase):
     pass
 
 
+def _json_serializer(value: Any) -> str:
+    """Serialize JSON columns with orjson"""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 # Create async engine with appropriate settings for SQLite vs PostgreSQL
 db_url = str(settings.database_url)
 is_sqlite = db_url.startswith("sqlite")
 
 engine_kwargs: dict[str, object] = {
     "echo": settings.debug,
+    # Compiled-statement LRU cache; route queries keep a constant shape to hit it
+    "query_cache_size": int(settings.database_query_cache_size),
+    "json_serializer": _json_serializer,
+    "json_deserializer": orjson.loads,
 }
 
 # SQLite doesn't support pool_size/max_overflow
 if not is_sqlite:
     engine_kwargs["pool_size"] = int(settings.database_pool_size)
     engine_kwargs["max_overflow"] = int(settings.database_max_overflow)
+    # Drop connections the server or a proxy has closed before handing
+    # them out, instead of failing the request that picks them up
+    engine_kwargs["pool_pre_ping"] = settings.database_pool_pre_ping
+    engine_kwargs["pool_recycle"] = int(settings.database_pool_recycle)
 
 # For SQLite, we need connect_args for async
 if is_sqlite:
@@ -45,6 +60,14 @@ async_session_factory = async_sessionmaker(
     expire_on_commit=False,
 )
 
+# Read-only work runs in autocommit mode on the same pool, so it skips the
+# BEGIN/COMMIT round trips around its queries
+read_session_factory = async_sessionmaker(
+    engine.execution_options(isolation_level="AUTOCOMMIT"),
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     """Dependency for getting database sessions"""
@@ -71,3 +94,10 @@ async def get_session_context() -> AsyncGenerator[AsyncSession, None]:
             raise
         finally:
             await session.close()
+
+
+@asynccontextmanager
+async def get_read_session_context() -> AsyncGenerator[AsyncSession, None]:
+    """Context manager for read-only database sessions (no transaction)"""
+    async with read_session_factory() as session:
+        yield session
@@ -0,0 +1,29 @@
+"""Shared outbound HTTP client for API request handlers"""
+
+import httpx
+
+# Pool sized for concurrent token exchanges against a handful of providers
+HTTP_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20)
+
+_http_client: httpx.AsyncClient | None = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get shared pooled HTTP client.
+
+    Bound to the API event loop; Celery tasks run their own loops and must
+    keep using per-instance clients.
+    """
+    global _http_client
+    if _http_client is None:
+        _http_client = httpx.AsyncClient(timeout=30.0, limits=HTTP_LIMITS)
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close shared HTTP client (called on application shutdown)"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
@@ -4,9 +4,28 @@ import logging
 import sys
 from typing import Literal
 
+import orjson
+
 from myome.core.config import settings
 
 
+class JSONFormatter(logging.Formatter):
+    """Format records as single-line JSON for log aggregation"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        # Epoch seconds skip the localtime/strftime pass of formatTime
+        entry = {
+            "ts": record.created,
+            "level": record.levelname,
+            "logger": record.name,
+            "line": record.lineno,
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return orjson.dumps(entry).decode()
+
+
 def setup_logging(
     level: Literal["DEBUG", "INFO", "WARNING", "ERROR"] = "INFO",
 ) -> logging.Logger:
@@ -14,11 +33,21 @@ def setup_logging(
 
     log_level = logging.DEBUG if settings.debug else getattr(logging, level)
 
-    # Create formatter
-    formatter = logging.Formatter(
-        fmt="%(asctime)s | %(levelname)-8s | %(name)s:%(lineno)d | %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-    )
+    # The format below never shows thread or process details, so skip
+    # collecting them for every record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
+    # Create formatter: JSON lines in production, readable text otherwise
+    formatter: logging.Formatter
+    if settings.environment == "production":
+        formatter = JSONFormatter()
+    else:
+        formatter = logging.Formatter(
+            fmt="%(asctime)s | %(levelname)-8s | %(name)s:%(lineno)d | %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+        )
 
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
@@ -2,12 +2,16 @@
 
 from datetime import datetime
 
-from sqlalchemy import DateTime, Float, ForeignKey, String, Text
+from sqlalchemy import DateTime, Float, ForeignKey, Index, String, Text, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from myome.core.database import Base
-from myome.core.models.mixins import TimestampMixin, UUIDMixin
+from myome.core.models.mixins import (
+    TimeOrderedUUIDMixin,
+    TimestampMixin,
+    UUIDMixin,
+)
 
 
 class BiomarkerDefinition(Base, UUIDMixin, TimestampMixin):
@@ -16,7 +20,7 @@ class BiomarkerDefinition(Base, UUIDMixin, TimestampMixin):
     __tablename__ = "biomarker_definitions"
 
     # Identification
-    code: Mapped[str] = mapped_column(String(50), unique=True, index=True)
+    code: Mapped[str] = mapped_column(String(50), unique=True)
     name: Mapped[str] = mapped_column(String(200), nullable=False)
     category: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
 
@@ -45,10 +49,27 @@ class BiomarkerDefinition(Base, UUIDMixin, TimestampMixin):
     loinc_code: Mapped[str | None] = mapped_column(String(20), nullable=True)
 
 
-class BiomarkerReading(Base, UUIDMixin):
+class BiomarkerReading(Base, TimeOrderedUUIDMixin):
     """Individual biomarker reading from lab or device"""
 
     __tablename__ = "biomarker_readings"
+    __table_args__ = (
+        # Readings arrive roughly in time order, so a block range index
+        # serves time-window scans at a fraction of a B-tree's size
+        Index(
+            "ix_biomarker_readings_timestamp_brin",
+            "timestamp",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        # Abnormal readings are a small minority; index only those
+        Index(
+            "ix_biomarker_readings_abnormal",
+            "user_id",
+            "timestamp",
+            postgresql_where=text("is_abnormal"),
+        ),
+    )
 
     user_id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
@@ -65,7 +86,6 @@ class BiomarkerReading(Base, UUIDMixin):
     timestamp: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        index=True,
     )
 
     # Value
@@ -4,16 +4,26 @@ from datetime import datetime
 from enum import Enum as PyEnum
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, DateTime, Float, ForeignKey, String
+from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Index, String, text
 from sqlalchemy.dialects.postgresql import ENUM, JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from myome.core.database import Base
-from myome.core.models.mixins import TimestampMixin, UUIDMixin
+from myome.core.models.mixins import (
+    TimeOrderedUUIDMixin,
+    TimestampMixin,
+    UUIDMixin,
+)
 
 if TYPE_CHECKING:
     from myome.core.models.user import User
 
+# Vendors connected through OAuth, limited to one device per user
+OAUTH_VENDOR_CLAUSE = "vendor IN ('whoop', 'withings')"
+
+# Devices picked up by the periodic sync
+SYNCABLE_DEVICE_CLAUSE = "is_connected AND api_credentials IS NOT NULL"
+
 
 class DeviceType(str, PyEnum):
     """Supported device types"""
@@ -53,6 +63,22 @@ class Device(Base, UUIDMixin, TimestampMixin):
     """Connected health device"""
 
     __tablename__ = "devices"
+    __table_args__ = (
+        # One OAuth-linked device per user and provider, so reconnects upsert
+        Index(
+            "uq_devices_user_oauth_vendor",
+            "user_id",
+            "vendor",
+            unique=True,
+            postgresql_where=text(OAUTH_VENDOR_CLAUSE),
+        ),
+        # The periodic sync only scans connected devices with credentials
+        Index(
+            "ix_devices_syncable",
+            "id",
+            postgresql_where=text(SYNCABLE_DEVICE_CLAUSE),
+        ),
+    )
 
     # Foreign key
     user_id: Mapped[str] = mapped_column(
@@ -142,10 +168,20 @@ class Device(Base, UUIDMixin, TimestampMixin):
         return f"<Device {self.name} ({self.vendor}/{self.device_type})>"
 
 
-class DeviceReading(Base, UUIDMixin):
+class DeviceReading(Base, TimeOrderedUUIDMixin):
     """Generic device reading for non-specialized data"""
 
     __tablename__ = "device_readings"
+    __table_args__ = (
+        # Synced readings arrive roughly in time order, so a block range index
+        # serves time-window scans at a fraction of a B-tree's size
+        Index(
+            "ix_device_readings_timestamp_brin",
+            "timestamp",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+    )
 
     # Foreign keys
     device_id: Mapped[str] = mapped_column(
@@ -163,11 +199,10 @@ class DeviceReading(Base, UUIDMixin):
     timestamp: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         nullable=False,
-        index=True,
     )
 
     # Reading type and value
-    reading_type: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
+    reading_type: Mapped[str] = mapped_column(String(50), nullable=False)
     value: Mapped[float] = mapped_column(Float, nullable=False)
     unit: Mapped[str] = mapped_column(String(20), nullable=False)
 
@@ -1,6 +1,6 @@
 """Genomic data models"""
 
-from sqlalchemy import Float, ForeignKey, Integer, String, Text
+from sqlalchemy import Float, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.dialects.postgresql import ARRAY, JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -12,6 +12,11 @@ class GenomicVariant(Base, UUIDMixin, TimestampMixin):
     """Genetic variant (SNP, indel, etc.)"""
 
     __tablename__ = "genomic_variants"
+    __table_args__ = (
+        # rsids are only ever matched by equality
+        Index("ix_genomic_variants_rsid_hash", "rsid", postgresql_using="hash"),
+        Index("ix_genomic_variants_locus", "chromosome", "position"),
+    )
 
     user_id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
@@ -20,7 +25,7 @@ class GenomicVariant(Base, UUIDMixin, TimestampMixin):
     )
 
     # Variant identification
-    rsid: Mapped[str | None] = mapped_column(String(20), index=True, nullable=True)
+    rsid: Mapped[str | None] = mapped_column(String(20), nullable=True)
     chromosome: Mapped[str] = mapped_column(String(5), nullable=False)
     position: Mapped[int] = mapped_column(Integer, nullable=False)
     reference_allele: Mapped[str] = mapped_column(String(1000), nullable=False)
@@ -2,7 +2,7 @@
 
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, String, Text
+from sqlalchemy import DateTime, ForeignKey, Index, String, Text, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -48,9 +48,12 @@ class LabPanel(Base, UUIDMixin, TimestampMixin):
     notes: Mapped[str | None] = mapped_column(Text, nullable=True)
 
     # Relationships
+    # Loaded with one batched IN query per list of panels; async sessions
+    # cannot lazy-load per panel
     results: Mapped[list["LabResult"]] = relationship(
         "LabResult",
         back_populates="panel",
+        lazy="selectin",
     )
 
 
@@ -58,6 +61,14 @@ class LabResult(Base, UUIDMixin):
     """Individual lab test result within a panel"""
 
     __tablename__ = "lab_results"
+    __table_args__ = (
+        # Abnormal results are a small minority; index only those
+        Index(
+            "ix_lab_results_abnormal",
+            "user_id",
+            postgresql_where=text("is_abnormal"),
+        ),
+    )
 
     panel_id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
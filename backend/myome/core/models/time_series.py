@@ -1,7 +1,6 @@
 """Time-series models for high-frequency health data (TimescaleDB hypertables)"""
 
 from datetime import datetime
-from uuid import uuid4
 
 from sqlalchemy import (
     Boolean,
@@ -11,11 +10,15 @@ from sqlalchemy import (
     Index,
     Integer,
     String,
+    TableClause,
+    column,
+    table,
 )
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
 from myome.core.database import Base
+from myome.core.models.mixins import uuid7
 
 
 class HeartRateReading(Base):
@@ -46,7 +49,15 @@ class HeartRateReading(Base):
     activity_type: Mapped[str | None] = mapped_column(String(50), nullable=True)
     confidence: Mapped[float | None] = mapped_column(Float, nullable=True)
 
-    __table_args__ = (Index("ix_hr_user_time", "user_id", "timestamp"),)
+    # Covers the analytics loader's projection for index-only range scans
+    __table_args__ = (
+        Index(
+            "ix_hr_user_time_cov",
+            "user_id",
+            "timestamp",
+            postgresql_include=["heart_rate_bpm", "confidence"],
+        ),
+    )
 
 
 class HRVReading(Base):
@@ -113,7 +124,15 @@ class GlucoseReading(Base):
     device_id: Mapped[str | None] = mapped_column(UUID(as_uuid=False), nullable=True)
     meal_context: Mapped[str | None] = mapped_column(String(50), nullable=True)
 
-    __table_args__ = (Index("ix_glucose_user_time", "user_id", "timestamp"),)
+    # Covers the analytics loader's projection for index-only range scans
+    __table_args__ = (
+        Index(
+            "ix_glucose_user_time_cov",
+            "user_id",
+            "timestamp",
+            postgresql_include=["glucose_mg_dl", "trend"],
+        ),
+    )
 
 
 class SleepSession(Base):
@@ -124,12 +143,11 @@ class SleepSession(Base):
     id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
         primary_key=True,
-        default=lambda: str(uuid4()),
+        default=uuid7,
     )
     user_id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
         ForeignKey("users.id", ondelete="CASCADE"),
-        index=True,
     )
 
     # Session timing
@@ -189,7 +207,6 @@ class SleepEpoch(Base):
     session_id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
         ForeignKey("sleep_sessions.id", ondelete="CASCADE"),
-        index=True,
     )
 
     # Sleep stage: wake, light, deep, rem
@@ -277,3 +294,22 @@ class BodyComposition(Base):
     device_id: Mapped[str | None] = mapped_column(UUID(as_uuid=False), nullable=True)
 
     __table_args__ = (Index("ix_body_comp_user_time", "user_id", "timestamp"),)
+
+
+def _daily_rollup(name: str, *value_columns: str) -> TableClause:
+    """Read-only handle on a daily continuous aggregate"""
+    return table(
+        name,
+        column("user_id", UUID(as_uuid=False)),
+        column("day", DateTime(timezone=True)),
+        *(column(c, Float) for c in value_columns),
+    )
+
+
+# Daily averages maintained by TimescaleDB continuous aggregates (created in
+# migrations, not part of the ORM metadata)
+heart_rate_daily = _daily_rollup("heart_rate_daily", "heart_rate_bpm", "confidence")
+hrv_daily = _daily_rollup(
+    "hrv_daily", "sdnn_ms", "rmssd_ms", "pnn50_pct", "lf_hf_ratio"
+)
+glucose_daily = _daily_rollup("glucose_daily", "glucose_mg_dl")
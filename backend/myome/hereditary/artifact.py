@@ -8,6 +8,8 @@ from datetime import UTC, datetime, timedelta
 from typing import Any
 from uuid import uuid4
 
+import numpy as np
+
 from myome.analytics.data_loader import TimeSeriesLoader
 from myome.core.logging import logger
 
@@ -225,8 +227,6 @@ class HereditaryArtifact:
 
     def _compute_trend(self, series: Any) -> dict:
         """Compute trend analysis"""
-        import numpy as np
-
         if len(series) < 3:
             return {"direction": "insufficient_data"}
 
@@ -215,6 +215,28 @@ CONDITION_PATTERNS = {
 }
 
 
+# Date patterns, tried in order
+DATE_PATTERNS = [
+    r"Date[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})",
+    r"(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})",
+    r"(\w+ \d{1,2},? \d{4})",
+]
+
+# Common medication patterns (first group captures dosage)
+MEDICATION_PATTERNS = [
+    ("metformin", r"Metformin\s*(?:(\d+\s*mg))?"),
+    ("lisinopril", r"Lisinopril\s*(?:(\d+\s*mg))?"),
+    ("atorvastatin", r"(?:Atorvastatin|Lipitor)\s*(?:(\d+\s*mg))?"),
+    ("simvastatin", r"(?:Simvastatin|Zocor)\s*(?:(\d+\s*mg))?"),
+    ("amlodipine", r"(?:Amlodipine|Norvasc)\s*(?:(\d+\s*mg))?"),
+    ("metoprolol", r"(?:Metoprolol|Lopressor)\s*(?:(\d+\s*mg))?"),
+    ("omeprazole", r"(?:Omeprazole|Prilosec)\s*(?:(\d+\s*mg))?"),
+    ("levothyroxine", r"(?:Levothyroxine|Synthroid)\s*(?:(\d+\s*mcg))?"),
+    ("aspirin", r"Aspirin\s*(?:(\d+\s*mg))?"),
+    ("warfarin", r"(?:Warfarin|Coumadin)\s*(?:(\d+\s*mg))?"),
+]
+
+
 class FamilyDocumentProcessor:
     """
     Process uploaded family medical documents
@@ -227,6 +249,20 @@ class FamilyDocumentProcessor:
         self.biomarker_patterns: dict[str, BiomarkerPattern] = BIOMARKER_PATTERNS
         self.condition_patterns: dict[str, list[str]] = CONDITION_PATTERNS
 
+        # Compile all patterns once; instances are stateless and reusable
+        self._date_regexes = [re.compile(p, re.IGNORECASE) for p in DATE_PATTERNS]
+        self._biomarker_regexes = {
+            name: [re.compile(p, re.IGNORECASE) for p in config["patterns"]]
+            for name, config in self.biomarker_patterns.items()
+        }
+        self._condition_regexes = {
+            name: re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+            for name, patterns in self.condition_patterns.items()
+        }
+        self._medication_regexes = [
+            (name, re.compile(p, re.IGNORECASE)) for name, p in MEDICATION_PATTERNS
+        ]
+
     async def process_document(
         self,
         text: str,
@@ -302,15 +338,8 @@ class FamilyDocumentProcessor:
 
     def _extract_date(self, text: str) -> datetime | None:
         """Extract document date"""
-        # Common date patterns
-        patterns = [
-            r"Date[:\s]*(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})",
-            r"(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})",
-            r"(\w+ \d{1,2},? \d{4})",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for regex in self._date_regexes:
+            match = regex.search(text)
             if match:
                 try:
                     date_str = match.group(1)
@@ -336,9 +365,8 @@ class FamilyDocumentProcessor:
         biomarkers = []
 
         for name, config in self.biomarker_patterns.items():
-            patterns = config["patterns"]
-            for pattern in patterns:
-                match = re.search(pattern, text, re.IGNORECASE)
+            for regex in self._biomarker_regexes[name]:
+                match = regex.search(text)
                 if match:
                     try:
                         value = float(match.group(1))
@@ -367,17 +395,15 @@ class FamilyDocumentProcessor:
         """Extract medical conditions from text"""
         conditions = []
 
-        for condition_name, patterns in self.condition_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, text, re.IGNORECASE):
-                    conditions.append(
-                        ExtractedCondition(
-                            name=condition_name,
-                            status="active",
-                            confidence=0.85,
-                        )
+        for condition_name, regex in self._condition_regexes.items():
+            if regex.search(text):
+                conditions.append(
+                    ExtractedCondition(
+                        name=condition_name,
+                        status="active",
+                        confidence=0.85,
                     )
-                    break
+                )
 
         return conditions
 
@@ -385,22 +411,8 @@ class FamilyDocumentProcessor:
         """Extract medications from text"""
         medications = []
 
-        # Common medication patterns
-        common_meds = [
-            ("metformin", r"Metformin\s*(?:(\d+\s*mg))?"),
-            ("lisinopril", r"Lisinopril\s*(?:(\d+\s*mg))?"),
-            ("atorvastatin", r"(?:Atorvastatin|Lipitor)\s*(?:(\d+\s*mg))?"),
-            ("simvastatin", r"(?:Simvastatin|Zocor)\s*(?:(\d+\s*mg))?"),
-            ("amlodipine", r"(?:Amlodipine|Norvasc)\s*(?:(\d+\s*mg))?"),
-            ("metoprolol", r"(?:Metoprolol|Lopressor)\s*(?:(\d+\s*mg))?"),
-            ("omeprazole", r"(?:Omeprazole|Prilosec)\s*(?:(\d+\s*mg))?"),
-            ("levothyroxine", r"(?:Levothyroxine|Synthroid)\s*(?:(\d+\s*mcg))?"),
-            ("aspirin", r"Aspirin\s*(?:(\d+\s*mg))?"),
-            ("warfarin", r"(?:Warfarin|Coumadin)\s*(?:(\d+\s*mg))?"),
-        ]
-
-        for med_name, pattern in common_meds:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for med_name, regex in self._medication_regexes:
+            match = regex.search(text)
             if match:
                 dosage = match.group(1) if match.lastindex and match.group(1) else None
                 medications.append(
@@ -9,14 +9,17 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
 )
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.ext.mutable import MutableDict, MutableList
 from sqlalchemy.orm import Mapped, mapped_column
 
 from myome.core.database import Base
-from myome.core.models.mixins import TimestampMixin
+from myome.core.models.mixins import TimestampMixin, UUIDMixin
 
 
 class FamilyRelationship(str, Enum):
@@ -59,7 +62,16 @@ RELATEDNESS_COEFFICIENTS = {
 }
 
 
-class FamilyMember(Base, TimestampMixin):
+def relatedness_for(relationship: str) -> float:
+    """Get genetic relatedness coefficient for a relationship name"""
+    try:
+        rel = FamilyRelationship(relationship)
+        return RELATEDNESS_COEFFICIENTS.get(rel, 0.125)
+    except ValueError:
+        return 0.125
+
+
+class FamilyMember(Base, UUIDMixin, TimestampMixin):
     """
     Family member health record.
 
@@ -71,10 +83,18 @@ class FamilyMember(Base, TimestampMixin):
     """
 
     __tablename__ = "family_members"
+    __table_args__ = (
+        # Containment lookups by condition, e.g. conditions @> '[{"condition": ...}]'
+        Index(
+            "ix_family_members_conditions",
+            "conditions",
+            postgresql_using="gin",
+            postgresql_ops={"conditions": "jsonb_path_ops"},
+        ),
+    )
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True)
     user_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("users.id"), nullable=False
+        UUID(as_uuid=False), ForeignKey("users.id"), nullable=False, index=True
     )
 
     # Relationship info
@@ -89,14 +109,20 @@ class FamilyMember(Base, TimestampMixin):
 
     # Health conditions (JSON array of condition objects)
     # Format: [{"condition": "type_2_diabetes", "onset_age": 55, "current": true}]
-    conditions: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    conditions: Mapped[list[dict] | None] = mapped_column(
+        MutableList.as_mutable(JSONB), nullable=True
+    )
 
     # Biomarker snapshots (JSON object with biomarker values)
     # Format: {"ldl": {"value": 188, "unit": "mg/dL", "age_at_measurement": 58}}
-    biomarkers: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    biomarkers: Mapped[dict | None] = mapped_column(
+        MutableDict.as_mutable(JSON), nullable=True
+    )
 
     # Medications (JSON array)
-    medications: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    medications: Mapped[list[dict] | None] = mapped_column(
+        MutableList.as_mutable(JSON), nullable=True
+    )
 
     # Lifestyle factors
     smoking_status: Mapped[str | None] = mapped_column(String(50), nullable=True)
@@ -107,7 +133,9 @@ class FamilyMember(Base, TimestampMixin):
     age_at_death: Mapped[int | None] = mapped_column(Integer, nullable=True)
 
     # Connected Myome user (if family member has their own account)
-    connected_user_id: Mapped[str | None] = mapped_column(String(36), nullable=True)
+    connected_user_id: Mapped[str | None] = mapped_column(
+        UUID(as_uuid=False), nullable=True
+    )
 
     # Data source tracking
     data_source: Mapped[str] = mapped_column(
@@ -121,11 +149,7 @@ class FamilyMember(Base, TimestampMixin):
     @property
     def relatedness(self) -> float:
         """Get genetic relatedness coefficient"""
-        try:
-            rel = FamilyRelationship(self.relationship)
-            return RELATEDNESS_COEFFICIENTS.get(rel, 0.125)
-        except ValueError:
-            return 0.125
+        return relatedness_for(self.relationship)
 
     @property
     def current_age(self) -> int | None:
@@ -137,7 +161,7 @@ class FamilyMember(Base, TimestampMixin):
         return datetime.now().year - self.birth_year
 
 
-class FamilyDocument(Base, TimestampMixin):
+class FamilyDocument(Base, UUIDMixin, TimestampMixin):
     """
     Uploaded family medical document.
 
@@ -146,12 +170,11 @@ class FamilyDocument(Base, TimestampMixin):
 
     __tablename__ = "family_documents"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True)
     user_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("users.id"), nullable=False
+        UUID(as_uuid=False), ForeignKey("users.id"), nullable=False
     )
     family_member_id: Mapped[str | None] = mapped_column(
-        String(36), ForeignKey("family_members.id"), nullable=True
+        UUID(as_uuid=False), ForeignKey("family_members.id"), nullable=True
     )
 
     # Document info
@@ -178,7 +201,7 @@ class FamilyDocument(Base, TimestampMixin):
     verified_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
 
 
-class WatchlistItem(Base, TimestampMixin):
+class WatchlistItem(Base, UUIDMixin, TimestampMixin):
     """
     Personalized health watchlist item based on family history.
 
@@ -187,9 +210,8 @@ class WatchlistItem(Base, TimestampMixin):
 
     __tablename__ = "watchlist_items"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True)
     user_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("users.id"), nullable=False
+        UUID(as_uuid=False), ForeignKey("users.id"), nullable=False, index=True
     )
 
     # Biomarker info
@@ -206,7 +228,7 @@ class WatchlistItem(Base, TimestampMixin):
     # Family context
     family_context: Mapped[str] = mapped_column(Text, nullable=False)
     contributing_family_member_id: Mapped[str | None] = mapped_column(
-        String(36), ForeignKey("family_members.id"), nullable=True
+        UUID(as_uuid=False), ForeignKey("family_members.id"), nullable=True
     )
 
     # Priority and recommendations
@@ -221,7 +243,7 @@ class WatchlistItem(Base, TimestampMixin):
     trigger_count: Mapped[int] = mapped_column(Integer, default=0)
 
 
-class HereditaryArtifactRecord(Base, TimestampMixin):
+class HereditaryArtifactRecord(Base, UUIDMixin, TimestampMixin):
     """
     Record of generated hereditary artifacts.
 
@@ -230,9 +252,8 @@ class HereditaryArtifactRecord(Base, TimestampMixin):
 
     __tablename__ = "hereditary_artifacts"
 
-    id: Mapped[str] = mapped_column(String(36), primary_key=True)
     user_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("users.id"), nullable=False
+        UUID(as_uuid=False), ForeignKey("users.id"), nullable=False
     )
 
     # Artifact info
@@ -60,12 +60,15 @@ class OAuthProvider(ABC):
         client_secret: str,
         redirect_uri: str,
         scopes: list[str],
+        http_client: httpx.AsyncClient | None = None,
     ):
         self.client_id = client_id
         self.client_secret = client_secret
         self.redirect_uri = redirect_uri
         self.scopes = scopes
-        self._http_client: httpx.AsyncClient | None = None
+        # An injected client is shared and stays open after close()
+        self._http_client = http_client
+        self._owns_http_client = http_client is None
 
     @property
     def http_client(self) -> httpx.AsyncClient:
@@ -74,7 +77,7 @@ class OAuthProvider(ABC):
         return self._http_client
 
     async def close(self) -> None:
-        if self._http_client:
+        if self._http_client and self._owns_http_client:
             await self._http_client.aclose()
             self._http_client = None
 
@@ -2,6 +2,8 @@
 
 from datetime import UTC, datetime, timedelta
 
+import httpx
+
 from myome.integrations.oauth.base import OAuthProvider, OAuthTokens
 
 
@@ -29,12 +31,14 @@ class WhoopOAuth(OAuthProvider):
         client_secret: str,
         redirect_uri: str,
         scopes: list[str] | None = None,
+        http_client: httpx.AsyncClient | None = None,
     ):
         super().__init__(
             client_id=client_id,
             client_secret=client_secret,
             redirect_uri=redirect_uri,
             scopes=scopes or self.DEFAULT_SCOPES,
+            http_client=http_client,
         )
 
     async def exchange_code(self, code: str) -> OAuthTokens:
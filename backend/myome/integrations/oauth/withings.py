@@ -2,6 +2,8 @@
 
 from datetime import UTC, datetime, timedelta
 
+import httpx
+
 from myome.integrations.oauth.base import OAuthProvider, OAuthTokens
 
 
@@ -24,12 +26,14 @@ class WithingsOAuth(OAuthProvider):
         client_secret: str,
         redirect_uri: str,
         scopes: list[str] | None = None,
+        http_client: httpx.AsyncClient | None = None,
     ):
         super().__init__(
             client_id=client_id,
             client_secret=client_secret,
             redirect_uri=redirect_uri,
             scopes=scopes or self.DEFAULT_SCOPES,
+            http_client=http_client,
         )
 
     def _extra_auth_params(self) -> dict:
@@ -1,6 +1,7 @@
 """Data ingestion service for coordinating sensor data collection"""
 
 import asyncio
+import time
 from datetime import datetime
 
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -15,6 +16,11 @@ from myome.core.models import (
 from myome.sensors.base import HealthSensor, Measurement, MultiSensorDevice, SensorType
 from myome.sensors.normalizer import DataNormalizer
 
+# Streamed measurements are committed in batches of up to this many, or once
+# the oldest buffered one has waited this long, instead of one transaction each
+STREAM_BATCH_SIZE = 1000
+STREAM_FLUSH_SECONDS = 5.0
+
 
 class IngestionService:
     """
@@ -197,22 +203,72 @@ class IngestionService:
         """Stop all streaming"""
         self._running = False
 
+    async def _flush_stream(
+        self,
+        sensor_id: str,
+        sensor_type: SensorType,
+        batch: list[Measurement],
+    ) -> None:
+        """Store a streamed batch, logging rather than raising on failure"""
+        if not batch:
+            return
+        try:
+            await self._store_measurements(sensor_type, batch)
+        except Exception as e:
+            logger.error(
+                f"Error storing {len(batch)} streamed measurements "
+                f"from {sensor_id}: {e}"
+            )
+
     async def _stream_sensor(self, sensor_id: str, sensor: HealthSensor) -> None:
         """Stream data from a single sensor"""
+        batch: list[Measurement] = []
+        flush_at = 0.0
+        pending: asyncio.Future[Measurement] | None = None
+
         try:
             await sensor.connect()
-
-            async for measurement in sensor.stream_data():
-                if not self._running:
-                    break
-
-                normalized = self.normalizer.normalize(measurement)
-                if normalized:
-                    await self._store_measurements(sensor.sensor_type, [normalized])
+            stream = aiter(sensor.stream_data())
+
+            while self._running:
+                # Keep one read outstanding across timeouts; cancelling it
+                # would close the stream
+                if pending is None:
+                    pending = asyncio.ensure_future(anext(stream))
+
+                # Wait no longer than the oldest buffered measurement may, so
+                # a quiet sensor still flushes on time
+                timeout = max(flush_at - time.monotonic(), 0.0) if batch else None
+                done, _ = await asyncio.wait({pending}, timeout=timeout)
+
+                if done:
+                    try:
+                        measurement = pending.result()
+                    except StopAsyncIteration:
+                        break
+                    finally:
+                        pending = None
+
+                    normalized = self.normalizer.normalize(measurement)
+                    if normalized:
+                        if not batch:
+                            flush_at = time.monotonic() + STREAM_FLUSH_SECONDS
+                        batch.append(normalized)
+
+                if batch and (
+                    len(batch) >= STREAM_BATCH_SIZE or time.monotonic() >= flush_at
+                ):
+                    # A failed batch is logged and dropped, not retried
+                    flushing, batch = batch, []
+                    await self._flush_stream(sensor_id, sensor.sensor_type, flushing)
 
         except NotImplementedError:
             logger.debug(f"Sensor {sensor_id} doesn't support streaming")
         except Exception as e:
             logger.error(f"Error streaming from {sensor_id}: {e}")
         finally:
+            if pending is not None:
+                pending.cancel()
+            # Keep what was buffered when the stream ends or fails
+            await self._flush_stream(sensor_id, sensor.sensor_type, batch)
             await sensor.disconnect()
@@ -1,6 +1,7 @@
 """Pytest configuration and fixtures"""
 
 import asyncio
+import os
 from collections.abc import AsyncGenerator
 from datetime import UTC, datetime, timedelta
 from uuid import uuid4
@@ -8,14 +9,43 @@ from uuid import uuid4
 import pytest
 import pytest_asyncio
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy.dialects.postgresql import ENUM
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from myome.api.main import app
+from myome.core import database
 from myome.core.database import Base, get_session
 from myome.core.models import HeartRateReading, User
 
-# Test database URL (use SQLite for tests)
-TEST_DATABASE_URL = "sqlite+aiosqlite:///./test_myome.db"
+# Test database URL (SQLite unless CI provides PostgreSQL)
+TEST_DATABASE_URL = os.environ.get("DATABASE_URL", "")
+if "postgresql" not in TEST_DATABASE_URL:
+    TEST_DATABASE_URL = "sqlite+aiosqlite:///./test_myome.db"
+
+
+def _enum_types(connection) -> list[ENUM]:
+    """Named PostgreSQL enums the models use but leave to migrations"""
+    if connection.dialect.name != "postgresql":
+        return []
+    types = {
+        column.type.name: column.type
+        for table in Base.metadata.tables.values()
+        for column in table.columns
+        if isinstance(column.type, ENUM)
+    }
+    return list(types.values())
+
+
+def _create_all(connection) -> None:
+    for enum in _enum_types(connection):
+        enum.create(connection, checkfirst=True)
+    Base.metadata.create_all(connection)
+
+
+def _drop_all(connection) -> None:
+    Base.metadata.drop_all(connection)
+    for enum in _enum_types(connection):
+        enum.drop(connection, checkfirst=True)
 
 
 @pytest.fixture(scope="session")
@@ -32,12 +62,12 @@ async def engine():
     engine = create_async_engine(TEST_DATABASE_URL, echo=False)
 
     async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_create_all)
 
     yield engine
 
     async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(_drop_all)
 
     await engine.dispose()
 
@@ -117,3 +147,18 @@ async def client(session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
         yield client
 
     app.dependency_overrides.clear()
+    # Read sessions use the app engine; drop its pooled connections before
+    # this test's event loop closes
+    await database.engine.dispose()
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    """Point the response cache at an in-memory Redis"""
+    from fakeredis import FakeAsyncRedis
+
+    from myome.core import cache
+
+    client = FakeAsyncRedis()
+    monkeypatch.setattr(cache, "_redis", client)
+    return client
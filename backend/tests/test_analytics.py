@@ -4,6 +4,7 @@ from datetime import UTC, datetime, timedelta
 
 import numpy as np
 import pandas as pd
+import pytest
 
 from myome.analytics.alerts.anomaly import (
     AlertPriority,
@@ -12,7 +13,7 @@ from myome.analytics.alerts.anomaly import (
     AnomalyType,
 )
 from myome.analytics.alerts.manager import AlertManager, AlertStatus
-from myome.analytics.correlation.engine import CorrelationResult
+from myome.analytics.correlation.engine import CorrelationEngine, CorrelationResult
 from myome.analytics.correlation.trends import TrendAnalyzer
 from myome.analytics.prediction.glucose import (
     GlucosePrediction,
@@ -56,6 +57,25 @@ class TestCorrelationResult:
         assert d["lag_days"] == 1
 
 
+class TestCorrelationEngine:
+    """Tests for correlation engine on loaded series"""
+
+    def test_lagged_correlations_find_shift(self):
+        """Test the strongest lag matches how far one series trails the other"""
+        rng = np.random.default_rng(0)
+        index = pd.date_range("2024-01-01", periods=90, freq="D", tz=UTC)
+        hr = rng.normal(60, 5, 90)
+        glucose = np.roll(hr, 2) + rng.normal(0, 1, 90)
+        df = pd.DataFrame({"heart_rate": hr, "glucose": glucose}, index=index)
+
+        engine = CorrelationEngine("user-123")
+        results = engine._lagged_correlations(df, "heart_rate", "glucose")
+
+        assert len(results) == 2 * engine.max_lag + 1
+        assert results[0].lag_days == 2
+        assert engine._correlate(df, "heart_rate", "sdnn_ms", 0) is None
+
+
 class TestTrendAnalyzer:
     """Tests for TrendAnalyzer"""
 
@@ -117,6 +137,35 @@ class TestTrendAnalyzer:
 
         assert result is None  # Less than 7 days
 
+    def test_compute_trends_batch_matches_per_column(self):
+        """Test batch trends match per-column trends with missing data"""
+        analyzer = TrendAnalyzer()
+
+        dates = pd.date_range(start="2026-01-01", periods=30, freq="D")
+        np.random.seed(42)
+        df = pd.DataFrame(
+            {
+                "rising": np.arange(100, 130) + np.random.normal(0, 1, 30),
+                "flat": 100 + np.random.normal(0, 2, 30),
+                "sparse": np.nan,
+            },
+            index=dates,
+        )
+        df.iloc[:5, 1] = np.nan
+        df.iloc[:4, 2] = np.arange(4)
+
+        results = analyzer.compute_trends_batch(df)
+
+        assert set(results) == {"rising", "flat"}
+        for column, batch in results.items():
+            single = analyzer.compute_trend(df[column], column)
+            assert single is not None
+            assert batch.start_date == single.start_date
+            assert batch.slope == pytest.approx(single.slope)
+            assert batch.p_value == pytest.approx(single.p_value)
+            assert batch.percent_change == pytest.approx(single.percent_change)
+            assert batch.direction == single.direction
+
     def test_detect_change_points(self):
         """Test change point detection"""
         analyzer = TrendAnalyzer()
@@ -424,3 +473,138 @@ class TestGlucosePrediction:
         assert prediction.predicted_peak_mg_dl == 145.0
         assert prediction.predicted_time_to_peak_minutes == 45
         assert prediction.confidence_interval == (130.0, 160.0)
+
+
+class TestReportStatistics:
+    """Tests for physician report summary statistics"""
+
+    def test_describe_matches_pandas(self):
+        """Test statistics skip missing values like pandas"""
+        from myome.clinical.reports.generator import _describe
+
+        series = pd.Series([110.0, np.nan, 95.0, 150.0, 72.0])
+
+        mean, std, minimum, maximum = _describe(series.to_numpy())
+
+        assert mean == pytest.approx(series.mean())
+        assert std == pytest.approx(series.std())
+        assert (minimum, maximum) == (72.0, 150.0)
+
+    def test_describe_without_values(self):
+        """Test missing statistics are NaN"""
+        from myome.clinical.reports.generator import _describe
+
+        assert all(np.isnan(v) for v in _describe(np.array([np.nan])))
+        assert np.isnan(_describe(np.array([80.0]))[1])
+
+    def test_slope_matches_polyfit(self):
+        """Test closed-form slope matches a degree-1 polyfit"""
+        from myome.clinical.reports.generator import _slope
+
+        x = np.arange(10, dtype=np.float64)
+        y = 0.5 * x + np.array([0.1, -0.2, 0.3, 0.0, -0.1, 0.2, -0.3, 0.1, 0.0, 0.2])
+
+        assert _slope(x, y) == pytest.approx(np.polyfit(x, y, 1)[0])
+
+
+def _fake_read_sessions(monkeypatch, *results):
+    """Serve queued query results (or raise queued errors) to the data loader"""
+    from contextlib import asynccontextmanager
+
+    from myome.analytics import data_loader
+
+    queue = list(results)
+
+    class FakeResult:
+        def __init__(self, rows):
+            self.rows = rows
+
+        def all(self):
+            return self.rows
+
+    class FakeSession:
+        async def execute(self, query):
+            result = queue.pop(0)
+            if isinstance(result, Exception):
+                raise result
+            return FakeResult(result)
+
+    @asynccontextmanager
+    async def fake_context():
+        yield FakeSession()
+
+    monkeypatch.setattr(data_loader, "get_read_session_context", fake_context)
+    return queue
+
+
+class TestTimeSeriesLoader:
+    """Tests for daily rollup loading"""
+
+    START = datetime(2024, 1, 1, tzinfo=UTC)
+    END = datetime(2024, 1, 3, 23, tzinfo=UTC)
+
+    async def test_daily_rollup_frame_shape(self, monkeypatch):
+        """Test rollup rows load as a float daily frame with gap days as NaN"""
+        from myome.analytics.data_loader import TimeSeriesLoader
+
+        _fake_read_sessions(
+            monkeypatch,
+            [
+                (self.START, 62, 0.9),
+                (self.START + timedelta(days=2), 70.5, None),
+            ],
+        )
+
+        df = await TimeSeriesLoader("user-1").load_heart_rate(
+            self.START, self.END, resample="1D"
+        )
+
+        assert df.index.name == "timestamp"
+        assert df.index.freq == "D"
+        assert list(df.columns) == ["heart_rate_bpm", "confidence"]
+        assert all(dtype == np.float64 for dtype in df.dtypes)
+        assert len(df) == 3
+        assert df.iloc[1].isna().all()
+        assert df["heart_rate_bpm"].iloc[2] == 70.5
+
+    async def test_empty_rollup_falls_back_to_raw(self, monkeypatch):
+        """Test days missing from the rollup are resampled from raw readings"""
+        from myome.analytics.data_loader import TimeSeriesLoader
+
+        raw = [
+            (self.START + timedelta(hours=1), 60, 0.9),
+            (self.START + timedelta(hours=2), 64, 0.7),
+            (self.START + timedelta(days=1), 70, 1.0),
+        ]
+        queue = _fake_read_sessions(monkeypatch, [], raw)
+
+        df = await TimeSeriesLoader("user-1").load_heart_rate(
+            self.START, self.END, resample="1D"
+        )
+
+        assert not queue
+        assert df.index.name == "timestamp"
+        assert df["heart_rate_bpm"].tolist() == [62.0, 70.0]
+        assert df["confidence"].tolist() == pytest.approx([0.8, 1.0])
+
+    async def test_missing_rollup_falls_back_to_raw(self, monkeypatch):
+        """Test schemas without the rollup views read raw readings instead"""
+        from sqlalchemy.exc import ProgrammingError
+
+        from myome.analytics.data_loader import TimeSeriesLoader
+
+        missing = ProgrammingError(
+            "SELECT", {}, Exception('relation "glucose_daily" does not exist')
+        )
+        raw = [
+            (self.START, 95.0, "flat"),
+            (self.START + timedelta(hours=3), 105.0, None),
+        ]
+        queue = _fake_read_sessions(monkeypatch, missing, raw)
+
+        df = await TimeSeriesLoader("user-1").load_glucose(
+            self.START, self.END, resample="1D"
+        )
+
+        assert not queue
+        assert df["glucose_mg_dl"].tolist() == [100.0]
@@ -253,6 +253,17 @@ class TestHealthRouteSchemas:
         assert reading.glucose_mg_dl == 105.5
         assert reading.meal_context == "fasting"
 
+    def test_reading_bounds(self):
+        """Test implausible heart rate and glucose values are rejected"""
+        from pydantic import ValidationError
+
+        from myome.api.routes.health import GlucoseCreate, HeartRateCreate
+
+        with pytest.raises(ValidationError):
+            HeartRateCreate(timestamp=datetime.now(UTC), heart_rate_bpm=500)
+        with pytest.raises(ValidationError):
+            GlucoseCreate(timestamp=datetime.now(UTC), glucose_mg_dl=0)
+
 
 class TestDeviceRouteSchemas:
     """Tests for device route schemas"""
@@ -306,3 +317,104 @@ class TestAlertRouteSchemas:
         assert alert.id == "alert-123"
         assert alert.priority == "high"
         assert alert.value == 185.0
+
+
+class TestHealthRouteQueries:
+    """Tests for health route query construction"""
+
+    def test_windowed_select_cache_key_is_stable(self):
+        """Test optional bounds do not change the compiled statement shape"""
+        from myome.api.routes.health import _windowed_select
+        from myome.core.models import HeartRateReading
+
+        col = HeartRateReading.timestamp
+        now = datetime.now(UTC)
+
+        unbounded = _windowed_select(HeartRateReading, col, "u1", None, None, 10)
+        bounded = _windowed_select(HeartRateReading, col, "u2", now, now, 500)
+
+        assert unbounded._generate_cache_key() == bounded._generate_cache_key()
+
+
+class TestClinicalRouteHelpers:
+    """Tests for clinical route helpers"""
+
+    def test_frame_observations_skips_empty_rows(self):
+        """Test observations are built only for rows with data"""
+        import numpy as np
+        import pandas as pd
+
+        from myome.api.routes.clinical import _frame_observations
+        from myome.clinical.fhir.resources import FHIRResourceGenerator
+
+        fhir = FHIRResourceGenerator("user-123")
+        index = pd.date_range("2024-01-01", periods=3, freq="1h", tz=UTC)
+        df = pd.DataFrame({"heart_rate_bpm": [60.0, np.nan, 72.4]}, index=index)
+
+        observations = _frame_observations(
+            df, "heart_rate_bpm", fhir.create_heart_rate_observation, int
+        )
+
+        assert [o["valueQuantity"]["value"] for o in observations] == [60, 72]
+        assert observations[1]["effectiveDateTime"] == "2024-01-01T02:00:00+00:00"
+        assert _frame_observations(df, "sdnn_ms", fhir.create_hrv_observation) == []
+
+    def test_frame_observations_limit(self):
+        """Test limit counts only rows with data"""
+        import numpy as np
+        import pandas as pd
+
+        from myome.api.routes.clinical import _frame_observations
+        from myome.clinical.fhir.resources import FHIRResourceGenerator
+
+        fhir = FHIRResourceGenerator("user-123")
+        index = pd.date_range("2024-01-01", periods=4, freq="1h", tz=UTC)
+        df = pd.DataFrame({"sdnn_ms": [np.nan, 40.0, 45.0, 50.0]}, index=index)
+
+        observations = _frame_observations(
+            df, "sdnn_ms", fhir.create_hrv_observation, limit=2
+        )
+
+        assert [o["valueQuantity"]["value"] for o in observations] == [40.0, 45.0]
+        assert fhir.create_bundle(iter(observations))["total"] == 2
+
+
+class TestHereditaryRouteHelpers:
+    """Tests for hereditary route helpers"""
+
+    def test_assess_risks_rounds_report(self):
+        """Test risk report values are rounded percentages"""
+        from myome.api.routes.hereditary import _assess_risks, _risk_assessment
+        from myome.hereditary.risk import FamilyOutcome
+
+        outcomes = [
+            FamilyOutcome(
+                condition="type_2_diabetes",
+                onset_age=45,
+                relatedness=0.5,
+                relationship="father",
+            )
+        ]
+
+        risks, priority = _assess_risks(_risk_assessment(35), outcomes)
+
+        diabetes = risks["type_2_diabetes"]
+        assert diabetes["population_risk"] == 10.0
+        assert diabetes["family_calibrated_risk"] > diabetes["population_risk"]
+        assert all(round(v, 1) == v for v in diabetes["confidence_interval"])
+        assert priority[0]["condition"] == "type_2_diabetes"
+        assert priority[0]["risk_increase_factor"] == diabetes["risk_increase_factor"]
+
+
+class TestAppMiddleware:
+    """Tests for application middleware"""
+
+    def test_gzip_enabled(self):
+        """Test large responses are gzip-compressed"""
+        from fastapi.middleware.gzip import GZipMiddleware
+
+        from myome.api.main import app
+
+        gzip = [m for m in app.user_middleware if m.cls is GZipMiddleware]
+        assert len(gzip) == 1
+        assert gzip[0].kwargs["minimum_size"] == 1000
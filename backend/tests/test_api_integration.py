@@ -5,10 +5,14 @@ with SQLite (local development). In CI, the PostgreSQL service is available.
 """
 
 import os
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 
 import pytest
 from httpx import AsyncClient
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from myome.core.models import GlucoseReading
 
 # Skip all tests in this module if not using PostgreSQL
 pytestmark = pytest.mark.skipif(
@@ -73,6 +77,74 @@ async def test_health_data_crud(
     assert len(data) >= 1
 
 
+@pytest.mark.asyncio
+async def test_health_data_bulk_insert(
+    client: AsyncClient,
+    session: AsyncSession,
+    auth_headers: dict,
+    test_user,
+):
+    """Test bulk heart rate and glucose ingestion"""
+    base_time = datetime.now(UTC)
+    readings = [
+        {
+            "timestamp": (base_time - timedelta(minutes=i)).isoformat(),
+            "heart_rate_bpm": 60 + i,
+        }
+        for i in range(50)
+    ]
+
+    response = await client.post(
+        "/api/v1/health/heart-rate/bulk",
+        json=readings,
+        headers=auth_headers,
+    )
+    assert response.status_code == 201
+    assert response.json()["inserted"] == 50
+
+    response = await client.post(
+        "/api/v1/health/glucose/bulk",
+        json=[{"timestamp": base_time.isoformat(), "glucose_mg_dl": 98.5}],
+        headers=auth_headers,
+    )
+    assert response.status_code == 201
+    assert response.json()["inserted"] == 1
+
+    # Bulk rows take the model's client-side defaults
+    result = await session.execute(
+        select(GlucoseReading.is_calibrated).where(
+            GlucoseReading.user_id == test_user.id
+        )
+    )
+    assert result.scalar_one() is True
+
+
+@pytest.mark.asyncio
+async def test_bulk_insert_invalidates_cache(
+    client: AsyncClient,
+    auth_headers: dict,
+    test_user,
+    fake_redis,
+):
+    """Test bulk ingestion drops the user's cached responses"""
+    from myome.core.cache import cache_key, get_or_compute
+
+    async def compute():
+        return {"score": 80}
+
+    key = cache_key(test_user.id, "analytics:score", "latest")
+    await get_or_compute(test_user.id, key, 300, compute)
+    assert await fake_redis.exists(key) == 1
+
+    response = await client.post(
+        "/api/v1/health/heart-rate/bulk",
+        json=[{"timestamp": datetime.now(UTC).isoformat(), "heart_rate_bpm": 64}],
+        headers=auth_headers,
+    )
+    assert response.status_code == 201
+    assert await fake_redis.exists(key) == 0
+
+
 @pytest.mark.asyncio
 async def test_analytics_endpoints(
     client: AsyncClient,
@@ -171,6 +243,34 @@ async def test_hereditary_endpoints(
     assert "risks" in data
 
 
+@pytest.mark.asyncio
+async def test_hereditary_risk_member_without_conditions(
+    client: AsyncClient,
+    auth_headers: dict,
+    test_user,
+):
+    """Test risk assessment counts members saved without conditions"""
+    for relationship, conditions in (
+        ("mother", None),
+        ("father", [{"condition": "type_2_diabetes", "onset_age": 50}]),
+    ):
+        response = await client.post(
+            "/api/v1/hereditary/family",
+            json={"relationship": relationship, "conditions": conditions},
+            headers=auth_headers,
+        )
+        assert response.status_code == 200
+
+    response = await client.get(
+        "/api/v1/hereditary/risk",
+        headers=auth_headers,
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["family_members_analyzed"] == 2
+    assert "type_2_diabetes" in data["risks"]
+
+
 @pytest.mark.asyncio
 async def test_device_endpoints(
     client: AsyncClient,
@@ -187,6 +287,13 @@ async def test_device_endpoints(
     devices = response.json()
     assert isinstance(devices, list)
 
+    # A second device for an OAuth vendor conflicts with the first
+    device = {"name": "Whoop", "device_type": "fitness_tracker", "vendor": "whoop"}
+    response = await client.post("/api/v1/devices/", json=device, headers=auth_headers)
+    assert response.status_code == 201
+    response = await client.post("/api/v1/devices/", json=device, headers=auth_headers)
+    assert response.status_code == 409
+
 
 @pytest.mark.asyncio
 async def test_alerts_endpoints(
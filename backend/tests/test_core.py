@@ -24,3 +24,131 @@ def test_myome_exception():
     assert exc.message == "Test error"
     assert exc.details == {"key": "value"}
     assert str(exc) == "Test error"
+
+
+def test_cache_key_is_user_scoped():
+    """Test cache keys are namespaced per user and endpoint"""
+    from myome.core.cache import cache_key
+
+    key = cache_key("user-1", "analytics:trends", 30)
+    assert key == "myome:cache:user-1:analytics:trends:30"
+    assert key != cache_key("user-2", "analytics:trends", 30)
+
+
+def test_uuid7_is_time_ordered():
+    """Test time-ordered ids carry version 7 and sort by creation time"""
+    import time
+    from uuid import UUID
+
+    from myome.core.models.mixins import uuid7
+
+    first = uuid7()
+    time.sleep(0.002)
+    second = uuid7()
+
+    assert UUID(first).version == 7
+    assert UUID(first).variant == "specified in RFC 4122"
+    assert first < second
+
+
+def test_json_formatter_emits_one_line():
+    """Test JSON log lines carry the record fields and exception text"""
+    import logging
+    import sys
+
+    import orjson
+
+    from myome.core.logging import JSONFormatter
+
+    try:
+        raise ValueError("bad")
+    except ValueError:
+        exc_info = sys.exc_info()
+
+    record = logging.LogRecord(
+        "myome.test", logging.ERROR, __file__, 10, "failed %s", ("sync",), exc_info
+    )
+    line = JSONFormatter().format(record)
+    entry = orjson.loads(line)
+
+    assert "\n" not in line
+    assert entry["message"] == "failed sync"
+    assert entry["level"] == "ERROR"
+    assert "ValueError: bad" in entry["exc"]
+
+
+async def test_get_or_compute_caches_on_miss(fake_redis):
+    """Test a miss computes and stores the value, and a hit skips compute"""
+    from myome.core.cache import cache_key, get_or_compute
+
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        return {"score": 82.5}
+
+    key = cache_key("user-1", "analytics:score", "latest")
+    assert await get_or_compute("user-1", key, 60, compute) == {"score": 82.5}
+    assert await get_or_compute("user-1", key, 60, compute) == {"score": 82.5}
+    assert len(calls) == 1
+
+
+async def test_get_or_compute_sets_ttls(fake_redis):
+    """Test entries expire after their TTL and the user index outlives them"""
+    from myome.core.cache import INDEX_TTL_SECONDS, cache_key, get_or_compute
+
+    async def compute():
+        return [1, 2, 3]
+
+    key = cache_key("user-1", "analytics:trends", 30)
+    await get_or_compute("user-1", key, 300, compute)
+
+    assert 0 < await fake_redis.ttl(key) <= 300
+    index_ttl = await fake_redis.ttl("myome:cache:user-1:__keys__")
+    assert 300 < index_ttl <= INDEX_TTL_SECONDS
+
+
+async def test_get_or_compute_falls_back_when_redis_fails(monkeypatch):
+    """Test Redis errors are logged and the value is computed directly"""
+    from redis.exceptions import ConnectionError
+
+    from myome.core import cache
+
+    class BrokenRedis:
+        async def get(self, key):
+            raise ConnectionError("redis down")
+
+        async def smembers(self, key):
+            raise ConnectionError("redis down")
+
+    monkeypatch.setattr(cache, "_redis", BrokenRedis())
+
+    async def compute():
+        return {"fresh": True}
+
+    key = cache.cache_key("user-1", "analytics:score", "latest")
+    assert await cache.get_or_compute("user-1", key, 60, compute) == {"fresh": True}
+    await cache.invalidate_user("user-1")
+
+
+async def test_invalidate_user_deletes_indexed_keys(fake_redis):
+    """Test invalidation drops a user's entries and leaves other users'"""
+    from myome.core.cache import cache_key, get_or_compute, invalidate_user
+
+    async def compute():
+        return {"value": 1}
+
+    keys = [
+        cache_key("user-1", "analytics:score", "latest"),
+        cache_key("user-1", "clinical:report", "latest", 3),
+    ]
+    other = cache_key("user-2", "analytics:score", "latest")
+    for key in keys:
+        await get_or_compute("user-1", key, 60, compute)
+    await get_or_compute("user-2", other, 60, compute)
+
+    await invalidate_user("user-1")
+
+    assert await fake_redis.exists(*keys) == 0
+    assert await fake_redis.exists("myome:cache:user-1:__keys__") == 0
+    assert await fake_redis.exists(other) == 1
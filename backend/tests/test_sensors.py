@@ -1,5 +1,6 @@
 """Tests for sensor abstraction layer"""
 
+import asyncio
 from datetime import UTC, datetime, timedelta
 
 import pytest
@@ -293,6 +294,115 @@ class TestManualEntrySensor:
         assert len(measurements) == 2  # Should exclude the 2-hour-old one
 
 
+def _streaming_sensor(count: int) -> ManualEntrySensor:
+    """Sensor that streams count heart rate readings, 60 bpm upward"""
+
+    class StreamingSensor(ManualEntrySensor):
+        def stream_data(self):
+            async def gen():
+                base = datetime.now(UTC)
+                for i in range(count):
+                    yield Measurement(
+                        timestamp=base + timedelta(seconds=i),
+                        value=60.0 + i,
+                        unit="bpm",
+                        sensor_type=SensorType.HEART_RATE,
+                    )
+
+            return gen()
+
+    return StreamingSensor(SensorType.HEART_RATE, "bpm", "test-user")
+
+
+class TestIngestionStreaming:
+    """Tests for streamed measurement ingestion"""
+
+    @pytest.mark.asyncio
+    async def test_stream_commits_in_batches(self, monkeypatch):
+        """Test streamed measurements are stored in bounded batches"""
+        from myome.sensors import ingestion
+        from myome.sensors.ingestion import IngestionService
+
+        batches: list[int] = []
+
+        async def store(sensor_type, measurements):
+            batches.append(len(measurements))
+            return len(measurements)
+
+        monkeypatch.setattr(ingestion, "STREAM_BATCH_SIZE", 3)
+        service = IngestionService("test-user")
+        monkeypatch.setattr(service, "_store_measurements", store)
+        service._running = True
+
+        await service._stream_sensor("hr", _streaming_sensor(7))
+
+        assert batches == [3, 3, 1]
+
+    @pytest.mark.asyncio
+    async def test_stream_survives_failed_batch(self, monkeypatch):
+        """Test a failed batch is dropped once and streaming continues"""
+        from myome.sensors import ingestion
+        from myome.sensors.ingestion import IngestionService
+
+        attempts: list[list[float]] = []
+
+        async def store(sensor_type, measurements):
+            attempts.append([m.value for m in measurements])
+            if len(attempts) == 1:
+                raise RuntimeError("database unavailable")
+            return len(measurements)
+
+        monkeypatch.setattr(ingestion, "STREAM_BATCH_SIZE", 3)
+        service = IngestionService("test-user")
+        monkeypatch.setattr(service, "_store_measurements", store)
+        service._running = True
+
+        await service._stream_sensor("hr", _streaming_sensor(7))
+
+        assert attempts == [[60.0, 61.0, 62.0], [63.0, 64.0, 65.0], [66.0]]
+
+    @pytest.mark.asyncio
+    async def test_stream_flushes_quiet_sensor(self, monkeypatch):
+        """Test buffered measurements flush on time without a new sample"""
+        from myome.sensors import ingestion
+        from myome.sensors.ingestion import IngestionService
+
+        flushed = asyncio.Event()
+
+        class QuietSensor(ManualEntrySensor):
+            def stream_data(self):
+                async def gen():
+                    for _ in range(2):
+                        yield Measurement(
+                            timestamp=datetime.now(UTC),
+                            value=60.0,
+                            unit="bpm",
+                            sensor_type=SensorType.HEART_RATE,
+                        )
+                        # Stay silent until the buffered sample is stored
+                        await asyncio.wait_for(flushed.wait(), timeout=1)
+                        flushed.clear()
+
+                return gen()
+
+        batches: list[int] = []
+
+        async def store(sensor_type, measurements):
+            batches.append(len(measurements))
+            flushed.set()
+            return len(measurements)
+
+        monkeypatch.setattr(ingestion, "STREAM_FLUSH_SECONDS", 0.01)
+        service = IngestionService("test-user")
+        monkeypatch.setattr(service, "_store_measurements", store)
+        service._running = True
+
+        sensor = QuietSensor(SensorType.HEART_RATE, "bpm", "test-user")
+        await service._stream_sensor("hr", sensor)
+
+        assert batches == [1, 1]
+
+
 class TestSensorRegistry:
     """Tests for sensor registry"""
 